@@ -7,22 +7,17 @@ This demonstrates the API usage for developers.
 """
 
 import sys
+import argparse
 from yo_mama.config import get_config
 from yo_mama.yo_mama_generator import YoMamaGenerator
 
 
-def demo_basic():
+def demo_basic(generator):
     """Demo 1: Basic joke generation."""
     print("\n" + "="*70)
     print("DEMO 1: Basic Joke Generation")
     print("="*70)
     
-    config = get_config()
-    generator = YoMamaGenerator(
-        api_key=config.gemini_api_key,
-        model_name=config.gemini_model
-    )
-    
     # Generate a simple joke
     joke = generator.generate_joke(
         flavor='tech',
@@ -33,18 +28,12 @@ def demo_basic():
     print(f"\n🎤 {joke}\n")
 
 
-def demo_flavors():
+def demo_flavors(generator):
     """Demo 2: Different flavors."""
     print("\n" + "="*70)
     print("DEMO 2: Different Flavors")
     print("="*70)
     
-    config = get_config()
-    generator = YoMamaGenerator(
-        api_key=config.gemini_api_key,
-        model_name=config.gemini_model
-    )
-    
     flavors = ['cybersecurity', 'linux', 'gaming', 'cloud']
     
     for flavor in flavors:
@@ -57,18 +46,12 @@ def demo_flavors():
         print(f"   {joke}")
 
 
-def demo_intensity_levels():
+def demo_intensity_levels(generator):
     """Demo 3: Different intensity levels."""
     print("\n" + "="*70)
     print("DEMO 3: Intensity Levels (Same Flavor, Different Settings)")
     print("="*70)
     
-    config = get_config()
-    generator = YoMamaGenerator(
-        api_key=config.gemini_api_key,
-        model_name=config.gemini_model
-    )
-    
     print("\n🔹 Gentle & Accessible (M:2, N:3)")
     joke1 = generator.generate_joke(flavor='tech', meanness=2, nerdiness=3)
     print(f"   {joke1}")
@@ -82,18 +65,12 @@ def demo_intensity_levels():
     print(f"   {joke3}")
 
 
-def demo_batch():
+def demo_batch(generator):
     """Demo 4: Batch generation."""
     print("\n" + "="*70)
     print("DEMO 4: Batch Generation")
     print("="*70)
     
-    config = get_config()
-    generator = YoMamaGenerator(
-        api_key=config.gemini_api_key,
-        model_name=config.gemini_model
-    )
-    
     print("\n📦 Generating 3 cybersecurity jokes...\n")
     jokes = generator.generate_batch(
         count=3,
@@ -102,22 +79,17 @@ def demo_batch():
         nerdiness=8
     )
     
-    for i, joke in enumerate(jokes, 1):
-        print(f"{i}. {joke}")
+    # One buffered write instead of a print per joke
+    sys.stdout.write("\n".join(f"{i}. {joke}" for i, joke in enumerate(jokes, 1)) + "\n")
+    sys.stdout.flush()
 
 
-def demo_custom_target():
+def demo_custom_target(generator):
     """Demo 5: Custom target name."""
     print("\n" + "="*70)
     print("DEMO 5: Custom Target Name")
     print("="*70)
     
-    config = get_config()
-    generator = YoMamaGenerator(
-        api_key=config.gemini_api_key,
-        model_name=config.gemini_model
-    )
-    
     targets = [
         ('your code', 'programming'),
         ('your server', 'devops'),
@@ -135,40 +107,51 @@ def demo_custom_target():
         print(f"   {joke}")
 
 
-def demo_random():
+def demo_random(generator):
     """Demo 6: Random jokes."""
     print("\n" + "="*70)
     print("DEMO 6: Random Jokes (Random Flavor & Intensity)")
     print("="*70)
     
-    config = get_config()
-    generator = YoMamaGenerator(
-        api_key=config.gemini_api_key,
-        model_name=config.gemini_model
-    )
-    
     print("\n🎲 Generating 3 completely random jokes...\n")
-    
-    for i in range(3):
-        joke = generator.random_joke()
-        print(f"{i+1}. {joke}")
+
+    jokes = [generator.random_joke() for _ in range(3)]
+    sys.stdout.write("\n".join(f"{i}. {joke}" for i, joke in enumerate(jokes, 1)) + "\n")
+    sys.stdout.flush()
 
 
 def main():
     """Run all demos."""
+    parser = argparse.ArgumentParser(description='Yo Mama Bot API demo')
+    parser.add_argument(
+        '--no-pause',
+        help='Run all demos without pausing (for CI/benchmarking)',
+        action='store_true'
+    )
+    args = parser.parse_args()
+
+    # Skip the interactive gates when requested or when stdin isn't a TTY,
+    # so the demo can run unattended (e.g. `time python demo.py --no-pause`)
+    interactive = sys.stdin.isatty() and not args.no_pause
+    if interactive:
+        pause = lambda: input("\nPress Enter for next demo...")
+    else:
+        pause = lambda: None
+
     print("\n" + "="*70)
     print("🎤 YO MAMA BOT - API DEMO")
     print("="*70)
     print("\nThis script demonstrates various ways to use the Yo Mama Bot API.")
     print("Each demo will generate jokes using Google Gemini AI.")
     print("\nNote: This will make multiple API calls. Press Ctrl+C to cancel.\n")
-    
-    try:
-        input("Press Enter to start demos (or Ctrl+C to cancel)...")
-    except KeyboardInterrupt:
-        print("\n\n👋 Cancelled.\n")
-        return 0
-    
+
+    if interactive:
+        try:
+            input("Press Enter to start demos (or Ctrl+C to cancel)...")
+        except KeyboardInterrupt:
+            print("\n\n👋 Cancelled.\n")
+            return 0
+
     # Check configuration
     config = get_config()
     is_valid, missing = config.validate()
@@ -179,25 +162,32 @@ def main():
             print(f"   - {key}")
         print("\nPlease set these in your .env file or Doppler.\n")
         return 1
-    
+
+    # Create the generator once and share it across all demos
+    # (avoids re-parsing config and re-initializing the Gemini client per demo)
+    generator = YoMamaGenerator(
+        api_key=config.gemini_api_key,
+        model_name=config.gemini_model
+    )
+
     try:
         # Run demos
-        demo_basic()
-        input("\nPress Enter for next demo...")
-        
-        demo_flavors()
-        input("\nPress Enter for next demo...")
-        
-        demo_intensity_levels()
-        input("\nPress Enter for next demo...")
-        
-        demo_batch()
-        input("\nPress Enter for next demo...")
-        
-        demo_custom_target()
-        input("\nPress Enter for next demo...")
-        
-        demo_random()
+        demo_basic(generator)
+        pause()
+
+        demo_flavors(generator)
+        pause()
+
+        demo_intensity_levels(generator)
+        pause()
+
+        demo_batch(generator)
+        pause()
+
+        demo_custom_target(generator)
+        pause()
+
+        demo_random(generator)
         
         # Summary
         print("\n" + "="*70)
@@ -11,18 +11,41 @@ Can also run as Discord or Matrix bot.
 import sys
 import logging
 import argparse
+from dataclasses import dataclass
 from typing import Optional
 from yo_mama.config import get_config
 from yo_mama.yo_mama_generator import YoMamaGenerator
 
 
+@dataclass(slots=True)
+class Settings:
+    """Mutable interactive-mode settings."""
+    flavor: str
+    meanness: int
+    nerdiness: int
+    target: Optional[str] = None
+
+
+# Level-name lookup cached at module load (skips getattr reflection)
+_LEVEL_MAP = {
+    'DEBUG': logging.DEBUG,
+    'INFO': logging.INFO,
+    'WARNING': logging.WARNING,
+    'ERROR': logging.ERROR,
+    'CRITICAL': logging.CRITICAL,
+}
+
+
 def setup_logging(level: str = 'INFO'):
-    """Configure logging for the application."""
-    numeric_level = getattr(logging, level.upper(), logging.INFO)
+    """Configure logging for the application (idempotent)."""
+    numeric_level = _LEVEL_MAP.get(level.upper(), logging.INFO)
+    # force=True replaces any existing handlers so repeated calls don't
+    # stack duplicate handlers (and double every log line)
     logging.basicConfig(
         level=numeric_level,
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
+        datefmt='%Y-%m-%d %H:%M:%S',
+        force=True
     )
 
 
@@ -32,11 +55,12 @@ def print_joke(joke: str, prefix: str = "🔥"):
 
 
 def print_batch(jokes: list[str]):
-    """Print multiple jokes with formatting."""
-    print("\n" + "="*70)
-    for i, joke in enumerate(jokes, 1):
-        print(f"\n{i}. {joke}")
-    print("\n" + "="*70 + "\n")
+    """Print multiple jokes with formatting (single buffered write)."""
+    buf = ["\n" + "="*70]
+    buf.extend(f"\n\n{i}. {joke}" for i, joke in enumerate(jokes, 1))
+    buf.append("\n\n" + "="*70 + "\n\n")
+    sys.stdout.write("".join(buf))
+    sys.stdout.flush()
 
 
 def interactive_mode(generator: YoMamaGenerator, config):
@@ -55,119 +79,129 @@ def interactive_mode(generator: YoMamaGenerator, config):
     print("  flavors - List available flavors")
     print("  settings - Show current settings")
     print("  quit - Exit\n")
-    
+
     # Current settings
-    current_flavor = config.default_flavor
-    current_meanness = config.default_meanness
-    current_nerdiness = config.default_nerdiness
-    current_target = None
-    
-    def show_settings():
+    settings = Settings(
+        flavor=config.default_flavor,
+        meanness=config.default_meanness,
+        nerdiness=config.default_nerdiness
+    )
+
+    def show_settings(arg: str = ''):
         print(f"\n⚙️  Current Settings:")
-        print(f"   Flavor: {current_flavor}")
-        print(f"   Meanness: {current_meanness}/10")
-        print(f"   Nerdiness: {current_nerdiness}/10")
-        print(f"   Target: {current_target or 'yo mama'}\n")
-    
+        print(f"   Flavor: {settings.flavor}")
+        print(f"   Meanness: {settings.meanness}/10")
+        print(f"   Nerdiness: {settings.nerdiness}/10")
+        print(f"   Target: {settings.target or 'yo mama'}\n")
+
+    def handle_flavors(arg: str):
+        print("\n📋 Available flavors:")
+        for flavor in YoMamaGenerator.list_flavors():
+            print(f"   - {flavor}")
+        print()
+
+    def handle_random(arg: str):
+        joke = generator.random_joke()
+        print_joke(joke, "🎲")
+
+    def handle_flavor(arg: str):
+        if YoMamaGenerator.is_flavor(arg):
+            settings.flavor = arg.lower()
+            print(f"✓ Flavor set to: {settings.flavor}")
+        else:
+            print(f"❌ Unknown flavor. Use 'flavors' to see options.")
+
+    def handle_meanness(arg: str):
+        try:
+            new_meanness = int(arg)
+            if 1 <= new_meanness <= 11:
+                settings.meanness = new_meanness
+                print(f"✓ Meanness set to: {settings.meanness}/11")
+            else:
+                print("❌ Meanness must be between 1 and 11 (these go to eleven! 🎸)")
+        except ValueError:
+            print("❌ Invalid number")
+
+    def handle_nerdiness(arg: str):
+        try:
+            new_nerdiness = int(arg)
+            if 1 <= new_nerdiness <= 10:
+                settings.nerdiness = new_nerdiness
+                print(f"✓ Nerdiness set to: {settings.nerdiness}/10")
+            else:
+                print("❌ Nerdiness must be between 1 and 10")
+        except ValueError:
+            print("❌ Invalid number")
+
+    def handle_target(arg: str):
+        if arg.lower() in ('none', 'reset'):
+            settings.target = None
+            print("✓ Target reset to 'yo mama'")
+        else:
+            settings.target = arg
+            print(f"✓ Target set to: {settings.target}")
+
+    def handle_batch(arg: str):
+        try:
+            count = int(arg)
+            if 1 <= count <= 20:
+                print(f"\n⏳ Generating {count} jokes...")
+                jokes = generator.generate_batch(
+                    count=count,
+                    flavor=settings.flavor,
+                    meanness=settings.meanness,
+                    nerdiness=settings.nerdiness,
+                    target_name=settings.target
+                )
+                print_batch(jokes)
+            else:
+                print("❌ Count must be between 1 and 20")
+        except ValueError:
+            print("❌ Invalid number")
+
+    # O(1) dispatch on the first token instead of an if/elif chain
+    handlers = {
+        'f': handle_flavor,
+        'm': handle_meanness,
+        'n': handle_nerdiness,
+        't': handle_target,
+        'b': handle_batch,
+        'r': handle_random,
+        'flavors': handle_flavors,
+        'settings': show_settings,
+    }
+
     show_settings()
-    
+
     while True:
         try:
             user_input = input("yo-mama-bot> ").strip()
-            
+
             if not user_input:
                 # Generate joke with current settings
                 joke = generator.generate_joke(
-                    flavor=current_flavor,
-                    meanness=current_meanness,
-                    nerdiness=current_nerdiness,
-                    target_name=current_target
+                    flavor=settings.flavor,
+                    meanness=settings.meanness,
+                    nerdiness=settings.nerdiness,
+                    target_name=settings.target
                 )
                 print_joke(joke)
-            
-            elif user_input.lower() == 'quit':
+                continue
+
+            parts = user_input.split(maxsplit=1)
+            command = parts[0].lower()
+            arg = parts[1].strip() if len(parts) > 1 else ''
+
+            if command == 'quit':
                 print("\n👋 Peace out! Keep roasting!\n")
                 break
-            
-            elif user_input.lower() == 'flavors':
-                print("\n📋 Available flavors:")
-                for flavor in YoMamaGenerator.list_flavors():
-                    print(f"   - {flavor}")
-                print()
-            
-            elif user_input.lower() == 'settings':
-                show_settings()
-            
-            elif user_input.lower() == 'r':
-                # Random joke
-                joke = generator.random_joke()
-                print_joke(joke, "🎲")
-            
-            elif user_input.startswith('f '):
-                # Change flavor
-                new_flavor = user_input[2:].strip()
-                if new_flavor.lower() in YoMamaGenerator.list_flavors():
-                    current_flavor = new_flavor.lower()
-                    print(f"✓ Flavor set to: {current_flavor}")
-                else:
-                    print(f"❌ Unknown flavor. Use 'flavors' to see options.")
-            
-            elif user_input.startswith('m '):
-                # Change meanness
-                try:
-                    new_meanness = int(user_input[2:].strip())
-                    if 1 <= new_meanness <= 11:
-                        current_meanness = new_meanness
-                        print(f"✓ Meanness set to: {current_meanness}/11")
-                    else:
-                        print("❌ Meanness must be between 1 and 11 (these go to eleven! 🎸)")
-                except ValueError:
-                    print("❌ Invalid number")
-            
-            elif user_input.startswith('n '):
-                # Change nerdiness
-                try:
-                    new_nerdiness = int(user_input[2:].strip())
-                    if 1 <= new_nerdiness <= 10:
-                        current_nerdiness = new_nerdiness
-                        print(f"✓ Nerdiness set to: {current_nerdiness}/10")
-                    else:
-                        print("❌ Nerdiness must be between 1 and 10")
-                except ValueError:
-                    print("❌ Invalid number")
-            
-            elif user_input.startswith('t '):
-                # Change target
-                new_target = user_input[2:].strip()
-                if new_target.lower() == 'none' or new_target.lower() == 'reset':
-                    current_target = None
-                    print("✓ Target reset to 'yo mama'")
-                else:
-                    current_target = new_target
-                    print(f"✓ Target set to: {current_target}")
-            
-            elif user_input.startswith('b '):
-                # Generate batch
-                try:
-                    count = int(user_input[2:].strip())
-                    if 1 <= count <= 20:
-                        print(f"\n⏳ Generating {count} jokes...")
-                        jokes = generator.generate_batch(
-                            count=count,
-                            flavor=current_flavor,
-                            meanness=current_meanness,
-                            nerdiness=current_nerdiness,
-                            target_name=current_target
-                        )
-                        print_batch(jokes)
-                    else:
-                        print("❌ Count must be between 1 and 20")
-                except ValueError:
-                    print("❌ Invalid number")
-            
+
+            handler = handlers.get(command)
+            if handler is not None:
+                handler(arg)
             else:
                 print("❌ Unknown command. Type 'quit' to exit or press Enter to generate a joke.")
-        
+
         except KeyboardInterrupt:
             print("\n\n👋 Interrupted. Peace out!\n")
             break
@@ -175,6 +209,36 @@ def interactive_mode(generator: YoMamaGenerator, config):
             print(f"\n❌ Error: {e}\n")
 
 
+def _int_1_10(value: str) -> int:
+    """Validate an integer argument in 1-10 without materializing choices."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: '{value}'")
+    if not 1 <= number <= 10:
+        raise argparse.ArgumentTypeError('must be between 1 and 10')
+    return number
+
+
+def _rewrite_legacy_bot_flags(argv: list[str]) -> list[str]:
+    """
+    Map legacy --discord/--matrix flags to the 'bot' subcommand.
+
+    Keeps `python main.py --discord [--log-level DEBUG ...]` working
+    while letting the common CLI path skip building (and importing
+    anything for) bot options. Shared flags are kept before the
+    subcommand, where the top-level parser expects them; only the bot
+    flags move behind it.
+    """
+    if argv and argv[0] == 'bot':
+        return argv
+    bot_flags = [arg for arg in argv if arg in ('--discord', '--matrix')]
+    if not bot_flags:
+        return argv
+    shared = [arg for arg in argv if arg not in ('--discord', '--matrix')]
+    return shared + ['bot'] + bot_flags
+
+
 def main():
     """Main entry point for the Yo Mama Bot."""
     parser = argparse.ArgumentParser(
@@ -202,16 +266,14 @@ Examples:
     parser.add_argument(
         '-m', '--meanness',
         help='Meanness level 1-10 (1=gentle, 10=brutal)',
-        type=int,
-        choices=range(1, 11),
+        type=_int_1_10,
         metavar='1-10'
     )
     
     parser.add_argument(
         '-n', '--nerdiness',
         help='Nerdiness level 1-10 (1=accessible, 10=very technical)',
-        type=int,
-        choices=range(1, 11),
+        type=_int_1_10,
         metavar='1-10'
     )
     
@@ -246,6 +308,12 @@ Examples:
         action='store_true'
     )
     
+    parser.add_argument(
+        '--no-cache',
+        help='Disable the joke response cache',
+        action='store_true'
+    )
+
     parser.add_argument(
         '--log-level',
         help='Set logging level',
@@ -253,19 +321,22 @@ Examples:
         default=None
     )
     
-    parser.add_argument(
+    # Bot modes live in their own subparser so the common CLI path never
+    # pays for them (and the platform SDK imports stay behind this branch)
+    subparsers = parser.add_subparsers(dest='cmd')
+    bot_parser = subparsers.add_parser('bot', help='Run as a chat bot')
+    bot_parser.add_argument(
         '--discord',
         help='Run as Discord bot',
         action='store_true'
     )
-    
-    parser.add_argument(
+    bot_parser.add_argument(
         '--matrix',
         help='Run as Matrix bot',
         action='store_true'
     )
-    
-    args = parser.parse_args()
+
+    args = parser.parse_args(_rewrite_legacy_bot_flags(sys.argv[1:]))
     
     # Load configuration
     config = get_config()
@@ -283,33 +354,46 @@ Examples:
         return 0
     
     # Run as bot if requested
-    if args.discord and args.matrix:
-        # Run both bots concurrently
-        import threading
-        from yo_mama.platforms import run_discord_bot, run_matrix_bot
-        
-        print("\n🤖 Starting Discord and Matrix bots...\n")
-        
-        # Start Discord in a thread
-        discord_thread = threading.Thread(target=run_discord_bot, daemon=False)
-        discord_thread.start()
-        
-        # Start Matrix in main thread (blocks)
-        run_matrix_bot()
-        return 0
-    
-    elif args.discord:
-        from yo_mama.platforms import run_discord_bot
-        print("\n🤖 Starting Discord bot...\n")
-        run_discord_bot()
-        return 0
-    
-    elif args.matrix:
-        from yo_mama.platforms import run_matrix_bot
-        print("\n🤖 Starting Matrix bot...\n")
-        run_matrix_bot()
-        return 0
-    
+    if args.cmd == 'bot':
+        if args.discord and args.matrix:
+            # Run both bots concurrently
+            import threading
+            from yo_mama.platforms import run_discord_bot, run_matrix_bot
+
+            print("\n🤖 Starting Discord and Matrix bots...\n")
+
+            # Share one generator so both bots reuse the same Gemini
+            # client connection and joke cache (the cache is thread-safe)
+            generator = YoMamaGenerator(
+                api_key=config.gemini_api_key,
+                model_name=config.gemini_model
+            )
+
+            # Start Discord in a thread
+            discord_thread = threading.Thread(
+                target=run_discord_bot, args=(generator,), daemon=False
+            )
+            discord_thread.start()
+
+            # Start Matrix in main thread (blocks)
+            run_matrix_bot(generator)
+            return 0
+
+        elif args.discord:
+            from yo_mama.platforms import run_discord_bot
+            print("\n🤖 Starting Discord bot...\n")
+            run_discord_bot()
+            return 0
+
+        elif args.matrix:
+            from yo_mama.platforms import run_matrix_bot
+            print("\n🤖 Starting Matrix bot...\n")
+            run_matrix_bot()
+            return 0
+
+        else:
+            bot_parser.error('specify --discord and/or --matrix')
+
     # Validate configuration for CLI mode
     is_valid, missing = config.validate()
     if not is_valid:
@@ -320,11 +404,24 @@ Examples:
         print("See .env.example for reference.\n")
         return 1
     
-    # Initialize generator
+    # Initialize generator (with optional response cache)
     try:
+        cache = None
+        if config.cache_enabled and not args.no_cache:
+            from yo_mama.cache import LLMCache
+            cache = LLMCache(ttl=config.cache_ttl)
+
+        throttle = None
+        if config.rpm or config.tpm:
+            from yo_mama.throttle import AsyncTokenBucket
+            throttle = AsyncTokenBucket(rpm=config.rpm, tpm=config.tpm)
+
         generator = YoMamaGenerator(
             api_key=config.gemini_api_key,
-            model_name=config.gemini_model
+            model_name=config.gemini_model,
+            cache=cache,
+            max_concurrency=config.max_concurrency,
+            throttle=throttle
         )
     except Exception as e:
         print(f"\n❌ Failed to initialize generator: {e}\n")
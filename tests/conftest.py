@@ -0,0 +1,82 @@
+# SPDX-FileCopyrightText: 2025 YoMama-as-a-Service contributors
+# SPDX-License-Identifier: MPL-2.0
+"""
+Shared pytest fixtures for the test suite.
+"""
+
+import copy
+from types import SimpleNamespace
+
+import pytest
+from unittest.mock import Mock
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        '--integration',
+        action='store_true',
+        default=False,
+        help='run integration tests that hit the real Gemini API'
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        'markers',
+        'integration: test hits the real Gemini API (needs --integration)'
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip integration tests unless --integration was passed."""
+    if config.getoption('--integration'):
+        return
+
+    skip_integration = pytest.mark.skip(reason='need --integration option to run')
+    for item in items:
+        if 'integration' in item.keywords:
+            item.add_marker(skip_integration)
+
+
+@pytest.fixture(scope='session')
+def shared_config():
+    """Session-wide Config instance (avoids re-resolving secrets per test)."""
+    from yo_mama.config import get_config
+    return get_config()
+
+
+@pytest.fixture(scope='session')
+def _mock_client_template():
+    """Build the mock Gemini client tree once per session.
+
+    The canned response is a SimpleNamespace rather than a Mock: the
+    generator only reads .text, and a plain namespace is far cheaper
+    to construct and deepcopy than a full Mock.
+    """
+    client = Mock()
+    client.models.generate_content.return_value = SimpleNamespace(text="stub joke")
+    return client
+
+
+@pytest.fixture
+def mock_genai_client(monkeypatch, _mock_client_template):
+    """
+    Patch genai.Client with a Mock and return it.
+
+    Copying the session template is cheaper than constructing a fresh
+    Mock tree per test; deepcopy keeps call records and side_effects
+    isolated between tests (shallow copy would share child mocks).
+
+    The shared client cache is cleared on both sides so the mock never
+    leaks into other tests (and vice versa).
+    """
+    from yo_mama.yo_mama_generator import reset_client_cache
+
+    reset_client_cache()
+    client = copy.deepcopy(_mock_client_template)
+    monkeypatch.setattr(
+        'yo_mama.yo_mama_generator.genai.Client',
+        lambda **kwargs: client
+    )
+    yield client
+    reset_client_cache()
@@ -0,0 +1,73 @@
+# SPDX-FileCopyrightText: 2025 YoMama-as-a-Service contributors
+# SPDX-License-Identifier: MPL-2.0
+"""
+Record/replay Gemini client for integration tests.
+
+Lives outside conftest.py so tests can import it normally (conftest
+modules are collected by pytest, not meant to be imported directly).
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+# Recorded Gemini responses for record/replay integration testing
+LLM_MOCK_DIR = Path(__file__).parent / 'fixtures' / 'llm_mocks'
+
+
+def _mock_response_path(model, contents) -> Path:
+    """Fixture file for one (model, contents) request pair."""
+    digest = hashlib.sha1(f"{model}\x00{contents}".encode('utf-8')).hexdigest()
+    return LLM_MOCK_DIR / f"{digest}.json"
+
+
+def get_test_genai_client(api_key=None):
+    """
+    Return a Gemini client for integration tests, with record/replay.
+
+    Modes (controlled by environment variables):
+    - USE_MOCK_PROVIDER=1: return a Mock that replays recorded responses
+      from tests/fixtures/llm_mocks/ — deterministic, no key needed.
+    - UPDATE_MOCK_CACHE=1: call the real API and record each response
+      to the fixture cache for later replay.
+    - Neither: plain real client, nothing recorded.
+    """
+    if os.getenv('USE_MOCK_PROVIDER') == '1':
+        def replay(*, model, contents, **kwargs):
+            path = _mock_response_path(model, contents)
+            if not path.is_file():
+                pytest.fail(
+                    f"No recorded response for this request ({path.name}); "
+                    "run once with UPDATE_MOCK_CACHE=1 and a real API key"
+                )
+            data = json.loads(path.read_text())
+            return SimpleNamespace(text=data['text'])
+
+        client = Mock()
+        client.models.generate_content.side_effect = replay
+        return client
+
+    from google import genai
+    client = genai.Client(api_key=api_key)
+
+    if os.getenv('UPDATE_MOCK_CACHE') == '1':
+        real_generate = client.models.generate_content
+
+        def record(*, model, contents, **kwargs):
+            response = real_generate(model=model, contents=contents, **kwargs)
+            LLM_MOCK_DIR.mkdir(parents=True, exist_ok=True)
+            _mock_response_path(model, contents).write_text(
+                json.dumps({'model': model, 'text': response.text}, indent=2)
+            )
+            return response
+
+        recorder = Mock()
+        recorder.models.generate_content.side_effect = record
+        return recorder
+
+    return client
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: 2025 YoMama-as-a-Service contributors
+# SPDX-License-Identifier: MPL-2.0
+"""
+Test joke response cache functionality.
+"""
+
+from yo_mama.cache import JokePool, LLMCache, MemoryBackend, SQLiteJokeStore, cache_key
+
+
+def test_cache_key_deterministic():
+    """Test that identical parameters produce identical keys."""
+    key1 = cache_key('gemini-2.5-flash-lite', 'tech', 5, 5, None)
+    key2 = cache_key('gemini-2.5-flash-lite', 'tech', 5, 5, None)
+    assert key1 == key2
+
+
+def test_cache_key_varies_with_params():
+    """Test that different parameters produce different keys."""
+    key1 = cache_key('gemini-2.5-flash-lite', 'tech', 5, 5, None)
+    key2 = cache_key('gemini-2.5-flash-lite', 'linux', 5, 5, None)
+    assert key1 != key2
+
+
+def test_memory_backend_roundtrip():
+    """Test that values can be stored and retrieved."""
+    backend = MemoryBackend()
+    backend.set('abc', 'a joke')
+    assert backend.get('abc') == 'a joke'
+    assert backend.get('missing') is None
+
+
+def test_memory_backend_lru_eviction():
+    """Test that the oldest entry is evicted when full."""
+    backend = MemoryBackend(max_entries=2)
+    backend.set('a', 'joke a')
+    backend.set('b', 'joke b')
+    backend.set('c', 'joke c')
+    assert backend.get('a') is None
+    assert backend.get('c') == 'joke c'
+
+
+def test_llm_cache_roundtrip(tmp_path):
+    """Test the two-tier cache end to end."""
+    cache = LLMCache(cache_dir=tmp_path)
+    key = cache_key('model', 'tech', 5, 5, None)
+    cache.set(key, 'a cached joke')
+    assert cache.get(key) == 'a cached joke'
+
+    # A fresh cache instance should hit the file tier
+    cache2 = LLMCache(cache_dir=tmp_path)
+    assert cache2.get(key) == 'a cached joke'
+
+
+def test_joke_pool_serves_from_pool():
+    """Test that a filled pool serves pooled jokes."""
+    pool = JokePool(min_pool=1, hit_rate=1.0)
+    pool.add(('tech', 5, 5), 'joke one')
+    assert pool.sample(('tech', 5, 5)) == 'joke one'
+
+
+def test_joke_pool_misses_below_min_pool():
+    """Test that sparse pools force fresh generation."""
+    pool = JokePool(min_pool=3, hit_rate=1.0)
+    pool.add(('tech', 5, 5), 'joke one')
+    assert pool.sample(('tech', 5, 5)) is None
+    assert pool.sample(('linux', 5, 5)) is None
+
+
+def test_sqlite_joke_store_roundtrip(tmp_path):
+    """Test that stored jokes are served for matching parameters."""
+    store = SQLiteJokeStore(str(tmp_path / 'jokes.db'), hit_rate=1.0)
+    store.add('tech', 5, 5, 'a persisted joke')
+    assert store.sample('tech', 5, 5) == 'a persisted joke'
+    assert store.sample('linux', 5, 5) is None
+    store.close()
+
+
+def test_sqlite_joke_store_persists_across_connections(tmp_path):
+    """Test that jokes survive a reopen (fresh process simulation)."""
+    path = str(tmp_path / 'jokes.db')
+    store = SQLiteJokeStore(path, hit_rate=1.0)
+    store.add('tech', 5, 5, 'a persisted joke')
+    store.close()
+
+    store2 = SQLiteJokeStore(path, hit_rate=1.0)
+    assert store2.sample('tech', 5, 5) == 'a persisted joke'
+    store2.close()
@@ -5,39 +5,37 @@
 Test configuration loading and validation.
 """
 
-import unittest
-import os
-from yo_mama.config import get_config
-
-
-class TestConfig(unittest.TestCase):
-    """Test configuration functionality."""
-    
-    def test_config_loads(self):
-        """Test that configuration can be loaded."""
-        config = get_config()
-        self.assertIsNotNone(config)
-    
-    def test_config_has_model(self):
-        """Test that configuration has a model set."""
-        config = get_config()
-        self.assertIsNotNone(config.gemini_model)
-        self.assertIsInstance(config.gemini_model, str)
-        self.assertTrue(len(config.gemini_model) > 0)
-    
-    def test_config_has_defaults(self):
-        """Test that configuration has default values."""
-        config = get_config()
-        self.assertIsNotNone(config.default_flavor)
-        self.assertIsNotNone(config.default_meanness)
-        self.assertIsNotNone(config.default_nerdiness)
-        
-        # Check ranges
-        self.assertGreaterEqual(config.default_meanness, 1)
-        self.assertLessEqual(config.default_meanness, 10)
-        self.assertGreaterEqual(config.default_nerdiness, 1)
-        self.assertLessEqual(config.default_nerdiness, 10)
-
-
-if __name__ == '__main__':
-    unittest.main()
+import pytest
+from yo_mama.config import get_config, reset_config
+
+
+@pytest.fixture(autouse=True)
+def fresh_config():
+    """Start each test with a fresh config instance."""
+    reset_config()
+
+
+def test_config_loads():
+    """Test that configuration can be loaded."""
+    config = get_config()
+    assert config is not None
+
+
+def test_config_has_model():
+    """Test that configuration has a model set."""
+    config = get_config()
+    assert config.gemini_model is not None
+    assert isinstance(config.gemini_model, str)
+    assert len(config.gemini_model) > 0
+
+
+def test_config_has_defaults():
+    """Test that configuration has default values."""
+    config = get_config()
+    assert config.default_flavor is not None
+    assert config.default_meanness is not None
+    assert config.default_nerdiness is not None
+
+    # Check ranges
+    assert 1 <= config.default_meanness <= 10
+    assert 1 <= config.default_nerdiness <= 10
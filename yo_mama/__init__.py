@@ -7,20 +7,12 @@ Generate hilarious Yo Mama jokes with adjustable meanness and nerdiness levels
 across multiple themes: cybersecurity, tech, Linux, gaming, and more.
 """
 
+import importlib
+
 __version__ = "1.0.0"
 __author__ = "chiefgyk3d"
 __description__ = "AI-powered Yo Mama joke generator using Google Gemini"
 
-from .yo_mama_generator import YoMamaGenerator
-from .config import get_config, Config
-from .secrets import (
-    get_secret,
-    load_secrets_from_doppler,
-    load_secrets_from_aws,
-    load_secrets_from_vault,
-    get_secrets_for_platform
-)
-
 __all__ = [
     'YoMamaGenerator',
     'get_config',
@@ -31,3 +23,32 @@ __all__ = [
     'load_secrets_from_vault',
     'get_secrets_for_platform'
 ]
+
+# Submodule for each public symbol; imported lazily on first access
+# (PEP 562) so `import yo_mama` doesn't pay for google-genai et al.
+_SYMBOL_MODULES = {
+    'YoMamaGenerator': '.yo_mama_generator',
+    'get_config': '.config',
+    'Config': '.config',
+    'get_secret': '.secrets',
+    'load_secrets_from_doppler': '.secrets',
+    'load_secrets_from_aws': '.secrets',
+    'load_secrets_from_vault': '.secrets',
+    'get_secrets_for_platform': '.secrets',
+}
+
+
+def __getattr__(name):
+    """Lazily import public symbols on first access."""
+    module_name = _SYMBOL_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module = importlib.import_module(module_name, __name__)
+    value = getattr(module, name)
+    globals()[name] = value  # cache so __getattr__ only fires once
+    return value
+
+
+def __dir__():
+    return sorted(set(list(globals()) + __all__))
@@ -0,0 +1,283 @@
+# SPDX-FileCopyrightText: 2025 YoMama-as-a-Service contributors
+# SPDX-License-Identifier: MPL-2.0
+"""
+Response cache for generated jokes.
+
+Caches Gemini responses keyed by the full generation parameters so
+repeated dev/test invocations (demo reruns, test_setup.py, CI loops)
+don't burn API quota on identical requests.
+
+Backends:
+- MemoryBackend: in-process LRU (OrderedDict)
+- FileBackend: JSON files under ~/.cache/yomama with mtime-based TTL
+
+JokePool is the variety-preserving counterpart used by the bots: instead
+of pinning one response per parameter tuple it keeps a small pool of
+recent jokes per key and only sometimes serves from it. SQLiteJokeStore
+is its durable sibling: the same probabilistic serving, but persisted so
+jokes survive restarts and are shared across worker processes.
+"""
+
+import os
+import json
+import time
+import random
+import hashlib
+import logging
+import sqlite3
+import threading
+from collections import OrderedDict, deque
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# Default cache location and limits
+DEFAULT_CACHE_DIR = os.path.expanduser('~/.cache/yomama')
+DEFAULT_TTL_SECONDS = 3600  # 1 hour
+DEFAULT_MAX_ENTRIES = 256
+
+
+def cache_key(
+    model: str,
+    flavor: Optional[str],
+    meanness: int,
+    nerdiness: int,
+    target: Optional[str]
+) -> str:
+    """
+    Build a deterministic cache key from generation parameters.
+
+    Uses SHA-256 over a sorted JSON dump so the same parameters always
+    map to the same key, regardless of argument order.
+    """
+    payload = json.dumps(
+        {
+            'model': model,
+            'flavor': flavor,
+            'meanness': meanness,
+            'nerdiness': nerdiness,
+            'target': target,
+        },
+        sort_keys=True
+    )
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class MemoryBackend:
+    """In-memory LRU cache backend (thread-safe, shareable across bots)."""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, ttl: int = DEFAULT_TTL_SECONDS):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        """Get a cached value, or None if missing/expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            timestamp, value = entry
+            if time.time() - timestamp > self.ttl:
+                del self._entries[key]
+                return None
+
+            # Mark as recently used
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: str):
+        """Store a value, evicting the least-recently-used entry if full."""
+        with self._lock:
+            self._entries[key] = (time.time(), value)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+class FileBackend:
+    """File-based cache backend (one JSON file per key, mtime-based TTL)."""
+
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR, ttl: int = DEFAULT_TTL_SECONDS):
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def get(self, key: str) -> Optional[str]:
+        """Get a cached value, or None if missing/expired/unreadable."""
+        path = self._path(key)
+        try:
+            if time.time() - os.path.getmtime(path) > self.ttl:
+                os.remove(path)
+                return None
+
+            with open(path) as f:
+                return json.load(f)['joke']
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def set(self, key: str, value: str):
+        """Store a value; cache write failures are non-fatal."""
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(self._path(key), 'w') as f:
+                json.dump({'joke': value}, f)
+        except OSError as e:
+            logger.warning(f"Failed to write cache file: {e}")
+
+
+class JokePool:
+    """
+    Variety-preserving joke cache for repeated generation parameter tuples.
+
+    The generator is non-deterministic, so instead of pinning one joke
+    per key (what LLMCache does) this keeps a small pool of recent
+    results per key and only sometimes serves from it, keeping output
+    varied while skipping a share of Gemini round trips. Keys are LRU
+    evicted and expire after ttl seconds.
+
+    Thread-safe: the both-bots mode shares one pool between the Discord
+    and Matrix event loops, which run in separate threads.
+    """
+
+    def __init__(self, max_keys: int = 1024, per_key: int = 8,
+                 ttl: float = 3600.0, min_pool: int = 3, hit_rate: float = 0.5):
+        self._pools: OrderedDict[tuple, tuple[float, deque]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.max_keys = max_keys
+        self.per_key = per_key
+        self.ttl = ttl
+        self.min_pool = min_pool
+        self.hit_rate = hit_rate
+
+    def sample(self, key: tuple) -> Optional[str]:
+        """Return a pooled joke for key, or None to generate a fresh one."""
+        with self._lock:
+            entry = self._pools.get(key)
+            if entry is None:
+                return None
+
+            created, pool = entry
+            if time.monotonic() - created > self.ttl:
+                del self._pools[key]
+                return None
+
+            self._pools.move_to_end(key)
+            if len(pool) >= self.min_pool and random.random() < self.hit_rate:
+                return random.choice(pool)
+            return None
+
+    def add(self, key: tuple, joke: str):
+        """Record a freshly generated joke in the pool for key."""
+        with self._lock:
+            entry = self._pools.get(key)
+            if entry is None:
+                entry = (time.monotonic(), deque(maxlen=self.per_key))
+                self._pools[key] = entry
+                if len(self._pools) > self.max_keys:
+                    self._pools.popitem(last=False)
+            entry[1].append(joke)
+            self._pools.move_to_end(key)
+
+
+class SQLiteJokeStore:
+    """
+    Durable joke pool backed by SQLite (WAL mode, cross-process safe).
+
+    Unlike JokePool this survives restarts: in a multi-worker deployment
+    every worker appends to and samples from the same database file, so
+    a fresh process starts with the accumulated joke history instead of
+    an empty cache. Serving is probabilistic (hit_rate) with a random
+    row per parameter tuple, keeping output varied.
+    """
+
+    def __init__(self, path: str, hit_rate: float = 0.5):
+        self.hit_rate = hit_rate
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS jokes"
+                "(flavor TEXT, m INT, n INT, joke TEXT, ts REAL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_jokes_params"
+                " ON jokes(flavor, m, n)"
+            )
+            self._conn.commit()
+
+    def sample(self, flavor: str, meanness: int, nerdiness: int) -> Optional[str]:
+        """Return a stored joke for the parameters, or None to generate."""
+        if random.random() >= self.hit_rate:
+            return None
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT joke FROM jokes WHERE flavor=? AND m=? AND n=?"
+                    " ORDER BY RANDOM() LIMIT 1",
+                    (flavor, meanness, nerdiness)
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning("Joke store read failed: %s", e)
+            return None
+        return row[0] if row else None
+
+    def add(self, flavor: str, meanness: int, nerdiness: int, joke: str):
+        """Persist a freshly generated joke; write failures are non-fatal."""
+        try:
+            with self._lock:
+                self._conn.execute(
+                    "INSERT INTO jokes VALUES (?, ?, ?, ?, ?)",
+                    (flavor, meanness, nerdiness, joke, time.time())
+                )
+                self._conn.commit()
+        except sqlite3.Error as e:
+            logger.warning("Joke store write failed: %s", e)
+
+    def close(self):
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+class LLMCache:
+    """
+    Two-tier response cache: memory first, then file.
+
+    Lookups check memory, fall back to disk, and promote disk hits into
+    memory. Writes go to both tiers.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str = DEFAULT_CACHE_DIR,
+        ttl: int = DEFAULT_TTL_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES
+    ):
+        self.memory = MemoryBackend(max_entries=max_entries, ttl=ttl)
+        self.file = FileBackend(cache_dir=cache_dir, ttl=ttl)
+
+    def get(self, key: str) -> Optional[str]:
+        """Look up a cached joke by key."""
+        value = self.memory.get(key)
+        if value is not None:
+            logger.debug("Cache hit (memory)")
+            return value
+
+        value = self.file.get(key)
+        if value is not None:
+            logger.debug("Cache hit (file)")
+            self.memory.set(key, value)
+
+        return value
+
+    def set(self, key: str, value: str):
+        """Store a joke in both cache tiers."""
+        self.memory.set(key, value)
+        self.file.set(key, value)
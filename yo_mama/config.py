@@ -13,16 +13,22 @@ Priority order:
 
 import os
 import logging
+import threading
+from functools import cached_property, lru_cache
 from typing import Optional
-from dotenv import load_dotenv
 
-# Import our comprehensive secrets manager
-from .secrets import get_secret, load_secrets_from_doppler
+logger = logging.getLogger(__name__)
 
-# Load .env file
-load_dotenv()
 
-logger = logging.getLogger(__name__)
+@lru_cache(maxsize=1)
+def _ensure_dotenv_loaded():
+    """Load the .env file once, on first Config construction.
+
+    Deferred from module import so importers that never read config
+    values skip the filesystem walk and parse.
+    """
+    from dotenv import load_dotenv
+    load_dotenv()
 
 
 class Config:
@@ -31,16 +37,24 @@ class Config:
     
     Supports Doppler, AWS Secrets Manager, HashiCorp Vault, and .env fallback.
     """
-    
+
+    # Accepted truthy spellings for get_bool (built once, O(1) lookup)
+    _TRUTHY = frozenset({'true', '1', 'yes', 'on', 'enabled'})
+
+
     def __init__(self):
+        _ensure_dotenv_loaded()
+
         # Check which secrets managers are available
         self._has_doppler = bool(os.getenv('DOPPLER_TOKEN'))
         self._secrets_manager = os.getenv('SECRETS_MANAGER', 'none').lower()
-        
+
         if self._has_doppler:
+            from .secrets import load_secrets_from_doppler
             doppler_secrets = load_secrets_from_doppler()
-            logger.info(f"Doppler enabled with {len(doppler_secrets)} secrets")
-        
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Doppler enabled with %d secrets", len(doppler_secrets))
+
         if self._secrets_manager == 'aws':
             logger.info("AWS Secrets Manager enabled")
         elif self._secrets_manager == 'vault':
@@ -64,6 +78,7 @@ class Config:
         Returns:
             Secret value or default
         """
+        from .secrets import get_secret
         return get_secret(key, default=default)
     
     def get_config(self, key: str, default: Optional[str] = None) -> Optional[str]:
@@ -93,8 +108,8 @@ class Config:
         value = self.get_secret(key)
         if value is None:
             return default
-        
-        return value.lower() in ('true', '1', 'yes', 'on', 'enabled')
+
+        return value.lower() in self._TRUTHY
     
     def get_int(self, key: str, default: int = 0) -> int:
         """
@@ -114,41 +129,82 @@ class Config:
         try:
             return int(value)
         except ValueError:
-            logger.warning(f"Invalid integer value for {key}")
+            if logger.isEnabledFor(logging.WARNING):
+                logger.warning("Invalid integer value for %s", key)
             return default
     
     # Specific configuration getters
     
-    @property
+    @cached_property
     def gemini_api_key(self) -> Optional[str]:
         """Get Google Gemini API key."""
         return self.get_secret('GEMINI_API_KEY')
     
-    @property
+    @cached_property
     def gemini_model(self) -> str:
         """Get Gemini model name."""
         return self.get_secret('GEMINI_MODEL', 'gemini-2.5-flash-lite')
     
-    @property
+    @cached_property
     def default_flavor(self) -> str:
         """Get default joke flavor."""
         return self.get_secret('DEFAULT_FLAVOR', 'tech')
     
-    @property
+    @cached_property
     def default_meanness(self) -> int:
         """Get default meanness level."""
         return self.get_int('DEFAULT_MEANNESS', 5)
     
-    @property
+    @cached_property
     def default_nerdiness(self) -> int:
         """Get default nerdiness level."""
         return self.get_int('DEFAULT_NERDINESS', 5)
     
-    @property
+    @cached_property
+    def max_concurrency(self) -> int:
+        """Maximum concurrent Gemini requests in batch mode."""
+        return self.get_int('MAX_CONCURRENCY', 5)
+
+    @cached_property
+    def rpm(self) -> int:
+        """Gemini requests-per-minute budget (0 = unlimited)."""
+        return self.get_int('GEMINI_RPM', 0)
+
+    @cached_property
+    def tpm(self) -> int:
+        """Gemini tokens-per-minute budget (0 = unlimited)."""
+        return self.get_int('GEMINI_TPM', 0)
+
+    @cached_property
+    def cache_enabled(self) -> bool:
+        """Whether the joke response cache is enabled."""
+        return self.get_bool('CACHE_ENABLED', False)
+
+    @cached_property
+    def cache_ttl(self) -> int:
+        """Response cache TTL in seconds."""
+        return self.get_int('CACHE_TTL', 3600)
+
+    @cached_property
     def log_level(self) -> str:
         """Get logging level."""
         return self.get_secret('LOG_LEVEL', 'INFO')
     
+    def invalidate(self, key: Optional[str] = None):
+        """
+        Drop cached property values so they re-resolve on next access.
+
+        Args:
+            key: Specific property name to invalidate, or None for all
+        """
+        if key is not None:
+            self.__dict__.pop(key, None)
+            return
+
+        for name in list(self.__dict__):
+            if isinstance(getattr(type(self), name, None), cached_property):
+                del self.__dict__[name]
+
     def validate(self) -> tuple[bool, list[str]]:
         """
         Validate that all required configuration is present.
@@ -167,19 +223,47 @@ class Config:
         return is_valid, missing
 
 
-# Global config instance
-_config_instance = None
+# Environment keys that affect Config initialization; a change in any of
+# them invalidates the memoized instance
+_CONFIG_ENV_KEYS = ('DOPPLER_TOKEN', 'SECRETS_MANAGER', 'DOPPLER_PROJECT', 'DOPPLER_CONFIG')
+
+
+def _env_snapshot() -> tuple:
+    """Snapshot the environment values that Config initialization reads."""
+    return tuple(os.getenv(key) for key in _CONFIG_ENV_KEYS)
+
+
+_config_instance: Optional[Config] = None
+_config_snapshot: Optional[tuple] = None
+_config_lock = threading.Lock()
 
 
 def get_config() -> Config:
-    """Get the global config instance (singleton pattern)."""
-    global _config_instance
-    if _config_instance is None:
-        _config_instance = Config()
-    return _config_instance
+    """
+    Get the global config instance (memoized, thread-safe).
+
+    Double-checked locking: the hot path is two global reads with no
+    lock; the lock is only taken to build the instance, so concurrent
+    first-callers cannot both trigger a Doppler fetch. The instance is
+    rebuilt automatically if the secrets-manager environment (Doppler
+    token, SECRETS_MANAGER, etc.) changes.
+    """
+    global _config_instance, _config_snapshot
+
+    snapshot = _env_snapshot()
+    if _config_instance is not None and _config_snapshot == snapshot:
+        return _config_instance
+
+    with _config_lock:
+        if _config_instance is None or _config_snapshot != snapshot:
+            _config_instance = Config()
+            _config_snapshot = snapshot
+        return _config_instance
 
 
 def reset_config():
     """Reset the global config instance (useful for testing)."""
-    global _config_instance
-    _config_instance = None
+    global _config_instance, _config_snapshot
+    with _config_lock:
+        _config_instance = None
+        _config_snapshot = None
@@ -2,13 +2,31 @@
 # SPDX-License-Identifier: MPL-2.0
 """Platform integrations for Yo Mama Bot."""
 
-from .discord_bot import DiscordBot, run_discord_bot
-from .matrix_bot import MatrixBot, run_matrix_bot
+import importlib
 
 __all__ = ['DiscordBot', 'MatrixBot', 'run_discord_bot', 'run_matrix_bot']
-"""Platform integrations for Yo Mama Bot."""
 
-from .discord_bot import DiscordBot, run_discord_bot
-from .matrix_bot import MatrixBot, run_matrix_bot
+# Platform SDKs (discord.py, matrix-nio) are multi-hundred-ms imports;
+# load each bot module lazily so callers only pay for the one they use
+_SYMBOL_MODULES = {
+    'DiscordBot': '.discord_bot',
+    'run_discord_bot': '.discord_bot',
+    'MatrixBot': '.matrix_bot',
+    'run_matrix_bot': '.matrix_bot',
+}
 
-__all__ = ['DiscordBot', 'MatrixBot', 'run_discord_bot', 'run_matrix_bot']
+
+def __getattr__(name):
+    """Lazily import platform symbols on first access."""
+    module_name = _SYMBOL_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module = importlib.import_module(module_name, __name__)
+    value = getattr(module, name)
+    globals()[name] = value  # cache so __getattr__ only fires once
+    return value
+
+
+def __dir__():
+    return sorted(set(list(globals()) + __all__))
@@ -6,16 +6,98 @@ Discord bot platform for Yo Mama Bot.
 Supports slash commands, text commands, and webhook posting.
 """
 
+import asyncio
+import functools
+import hashlib
+import json
 import logging
+import os
+
+import aiohttp
+from typing import Optional
+
 import discord
 from discord import app_commands
 from discord.ext import commands
-from typing import Optional
+
+from ..cache import DEFAULT_CACHE_DIR, JokePool
 from ..config import get_config
 from ..yo_mama_generator import YoMamaGenerator
 
 logger = logging.getLogger(__name__)
 
+class _FrozenEmbed(discord.Embed):
+    """Embed whose serialized payload is computed once.
+
+    discord.py calls to_dict() on every send; for embeds that never
+    change, serializing once and returning the cached dict skips the
+    per-invocation field walk. (Embed uses __slots__, so this needs a
+    subclass rather than patching the instance.)
+    """
+
+    __slots__ = ('_frozen_payload',)
+
+    def to_dict(self):
+        payload = getattr(self, '_frozen_payload', None)
+        if payload is None:
+            payload = self._frozen_payload = super().to_dict()
+        return payload
+
+
+def _freeze_embed(embed: discord.Embed) -> discord.Embed:
+    """Rebuild an embed as a _FrozenEmbed with its payload pinned."""
+    frozen = _FrozenEmbed.from_dict(embed.to_dict())
+    frozen.to_dict()  # prime the cached payload
+    return frozen
+
+
+def _safe(default_msg: str):
+    """
+    Shared error boundary for slash handlers.
+
+    Replaces the per-command try/except scaffolding: failures are
+    logged with a traceback and reported to the user, via followup if
+    the interaction was already deferred. inspect.signature follows
+    __wrapped__, so discord.py still sees the real parameter list.
+    """
+    def deco(fn):
+        @functools.wraps(fn)
+        async def wrapper(interaction: discord.Interaction, *args, **kwargs):
+            try:
+                return await fn(interaction, *args, **kwargs)
+            except Exception as e:
+                logger.exception("%s", default_msg)
+                message = f"❌ {default_msg}: {e}"
+                if interaction.response.is_done():
+                    await interaction.followup.send(message)
+                else:
+                    await interaction.response.send_message(message)
+        return wrapper
+    return deco
+
+
+# Known flavors for O(1) validation of free-form text-command input
+# (already includes the thegame Easter egg)
+_VALID_FLAVORS = frozenset(YoMamaGenerator.list_flavors())
+
+# Flavor choices for /joke and /batch, built once at import. discord.py
+# mutates the list it is given, so decorators get a fresh list() copy.
+_FLAVOR_CHOICES = (
+    app_commands.Choice(name="🎭 Classic (Traditional Yo Mama)", value="classic"),
+    app_commands.Choice(name="🔒 Cybersecurity", value="cybersecurity"),
+    app_commands.Choice(name="💻 Tech (General Technology)", value="tech"),
+    app_commands.Choice(name="🐧 Linux", value="linux"),
+    app_commands.Choice(name="🌐 General", value="general"),
+    app_commands.Choice(name="🎮 Gaming", value="gaming"),
+    app_commands.Choice(name="👨‍💻 Programming", value="programming"),
+    app_commands.Choice(name="📡 Networking", value="networking"),
+    app_commands.Choice(name="☁️ Cloud", value="cloud"),
+    app_commands.Choice(name="🚀 DevOps", value="devops"),
+    app_commands.Choice(name="🗄️ Database", value="database"),
+    app_commands.Choice(name="📻 Amateur Radio (Ham Radio)", value="radio"),
+    app_commands.Choice(name="❓ Secret...", value="thegame"),  # Easter egg
+)
+
 
 class DiscordBot:
     """
@@ -28,48 +110,312 @@ class DiscordBot:
     - /flavors - List available flavors
     """
     
-    def __init__(self, config=None):
-        """Initialize the Discord bot."""
+    def __init__(self, config=None, generator=None):
+        """
+        Initialize the Discord bot.
+
+        Args:
+            config: Optional Config instance (default: global config)
+            generator: Optional shared YoMamaGenerator. Pass the same
+                       instance to multiple bots to share the Gemini
+                       client connection and joke cache.
+        """
         self.config = config or get_config()
-        
+
         # Bot setup with intents
         intents = discord.Intents.default()
         intents.message_content = True
         intents.guilds = True
-        
+
         self.bot = commands.Bot(
             command_prefix=self.config.get_config('DISCORD_PREFIX', '!'),
             intents=intents,
             help_command=None
         )
-        
-        # Initialize joke generator
-        self.generator = YoMamaGenerator(
+
+        # Initialize joke generator (or reuse a shared one)
+        self.generator = generator or YoMamaGenerator(
             api_key=self.config.gemini_api_key,
             model_name=self.config.gemini_model
         )
-        
+
+        # Pool of recent jokes per parameter tuple; lets repeated /joke
+        # calls sometimes skip the Gemini round trip without going stale
+        self._joke_pool = JokePool()
+
+        # Shared HTTP session for webhook posts, created lazily on the
+        # event loop; reusing it keeps TLS connections warm between posts
+        self._http_session: Optional[aiohttp.ClientSession] = None
+
+        # Snapshot per-command defaults: handlers read plain instance
+        # attributes instead of walking config descriptors per call
+        self.reload_defaults()
+
+        # Flavor tuple and static embeds: none of these vary per
+        # interaction, so resolve them once instead of per invocation
+        self._flavors = YoMamaGenerator.list_flavors()
+        self._flavors_embed = _freeze_embed(self._build_flavors_embed())
+        self._help_embed_slash = _freeze_embed(self._build_help_embed_slash())
+        self._help_embed_text = _freeze_embed(self._build_help_embed_text(self.bot.command_prefix))
+
         # Setup event handlers and commands
         self._setup_events()
         self._setup_commands()
         
         logger.info("Discord bot initialized")
     
+    def reload_defaults(self):
+        """Re-read the per-command defaults from config.
+
+        Call after changing configuration at runtime so handlers pick
+        up the new values.
+        """
+        self._default_flavor = self.config.default_flavor
+        self._default_meanness = self.config.default_meanness
+        self._default_nerdiness = self.config.default_nerdiness
+
+    _TREE_HASH_FILE = os.path.join(DEFAULT_CACHE_DIR, 'tree_hash')
+
+    def _command_tree_hash(self) -> Optional[str]:
+        """Hash the registered command definitions (None on failure)."""
+        try:
+            payload = json.dumps(
+                [cmd.to_dict(self.bot.tree) for cmd in self.bot.tree.get_commands()],
+                sort_keys=True
+            )
+            return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+        except Exception as e:
+            logger.debug("Could not hash command tree: %s", e)
+            return None
+
+    def _read_tree_hash(self) -> Optional[tuple[str, str]]:
+        """Read the (target, hash) pair recorded by the last successful sync.
+
+        The target is 'global' or a guild id; recording it means a
+        changed DISCORD_DEV_GUILD_ID forces a re-sync even when the
+        command definitions themselves are unchanged.
+        """
+        try:
+            with open(self._TREE_HASH_FILE, 'r') as f:
+                target, _, tree_hash = f.read().strip().partition(' ')
+        except OSError:
+            return None
+        if not tree_hash:
+            # Pre-target single-field file; treat as stale to force a sync
+            return None
+        return target, tree_hash
+
+    def _write_tree_hash(self, target: str, tree_hash: Optional[str]):
+        """Persist the sync target and command-tree hash; failures are non-fatal."""
+        if tree_hash is None:
+            return
+        try:
+            os.makedirs(DEFAULT_CACHE_DIR, exist_ok=True)
+            with open(self._TREE_HASH_FILE, 'w') as f:
+                f.write(f"{target} {tree_hash}")
+        except OSError as e:
+            logger.warning("Could not write tree hash: %s", e)
+
+    async def _warmup(self):
+        """Issue a tiny throwaway generation to open the Gemini connection."""
+        try:
+            await self.generator.generate_joke_async(
+                flavor=self._default_flavor,
+                meanness=1,
+                nerdiness=1
+            )
+            logger.info("Gemini connection warmed up")
+        except Exception as e:
+            logger.warning("Warmup request failed: %s", e)
+
+    def _make_thegame_embed(self, joke: str, mention: str = "") -> discord.Embed:
+        """Build the Easter-egg embed used by every thegame path."""
+        embed = discord.Embed(
+            description=f"{mention}🎮💀 {joke}",
+            color=discord.Color.purple()
+        )
+        embed.set_footer(text="You just lost The Game. Sorry! 😈")
+        return embed
+
+    def _make_joke_embed(self, joke: str, mention: str = "") -> discord.Embed:
+        """Build the standard joke embed (footer added by the caller)."""
+        return discord.Embed(
+            description=f"{mention}🎤 {joke}",
+            color=discord.Color.red()
+        )
+
+    def _build_flavors_embed(self) -> discord.Embed:
+        """Build the static /flavors embed."""
+        return discord.Embed(
+            title="📋 Available Joke Flavors",
+            description="\n".join([f"• `{flavor}`" for flavor in self._flavors]),
+            color=discord.Color.blue()
+        )
+
+    def _build_help_embed_slash(self) -> discord.Embed:
+        """Build the static /help embed."""
+        embed = discord.Embed(
+            title="🎤 Yo Mama Bot - Help",
+            description="AI-powered Yo Mama joke generator with customizable meanness and nerdiness!",
+            color=discord.Color.purple()
+        )
+
+        # Commands section
+        embed.add_field(
+            name="📝 Slash Commands",
+            value=(
+                "`/joke [flavor] [meanness] [nerdiness] [target]`\n"
+                "Generate a custom Yo Mama joke\n\n"
+                "`/random`\n"
+                "Generate a completely random joke\n\n"
+                "`/batch [count] [flavor] [meanness] [nerdiness]`\n"
+                "Generate multiple jokes (1-10)\n\n"
+                "`/flavors`\n"
+                "List all available joke flavors\n\n"
+                "`/help`\n"
+                "Show this help message"
+            ),
+            inline=False
+        )
+
+        # Parameters section
+        embed.add_field(
+            name="⚙️ Parameters",
+            value=(
+                "**Meanness (1-10):**\n"
+                "1 = Gentle and playful\n"
+                "10 = Absolutely savage\n\n"
+                "**Nerdiness (1-10):**\n"
+                "1 = Everyone can understand\n"
+                "10 = Extremely technical"
+            ),
+            inline=False
+        )
+
+        # Flavors section (reuse the Choice names; keep the Easter
+        # egg out of the listing)
+        flavor_list = [
+            f"{choice.name} - `{choice.value}`"
+            for choice in _FLAVOR_CHOICES if choice.value != "thegame"
+        ]
+        embed.add_field(
+            name="🎯 Available Flavors",
+            value="\n".join(flavor_list),
+            inline=False
+        )
+
+        # Examples section
+        embed.add_field(
+            name="💡 Examples",
+            value=(
+                "`/joke classic 7 1` - Classic fat/ugly jokes, pretty mean, easy to understand\n"
+                "`/joke cybersecurity 8 9` - Savage cybersecurity roast\n"
+                "`/joke linux 6 10` - Technical Linux joke\n"
+                "`/random` - Surprise me!\n"
+                "`/batch 3 tech 5 5` - Generate 3 tech jokes"
+            ),
+            inline=False
+        )
+
+        embed.set_footer(text=f"Prefix: {self.bot.command_prefix} | Powered by Google Gemini")
+        return embed
+
+    def _build_help_embed_text(self, prefix) -> discord.Embed:
+        """Build the static !help embed for text commands."""
+        embed = discord.Embed(
+            title="🎤 Yo Mama Bot - Help",
+            description="AI-powered Yo Mama joke generator with customizable meanness and nerdiness!",
+            color=discord.Color.purple()
+        )
+
+        # Commands section
+        embed.add_field(
+            name="📝 Text Commands",
+            value=(
+                f"`{prefix}joke [flavor] [meanness] [nerdiness]`\n"
+                "Generate a custom Yo Mama joke\n\n"
+                f"`{prefix}random`\n"
+                "Generate a completely random joke\n\n"
+                f"`{prefix}flavors`\n"
+                "List all available joke flavors\n\n"
+                f"`{prefix}help`\n"
+                "Show this help message"
+            ),
+            inline=False
+        )
+
+        # Parameters section
+        embed.add_field(
+            name="⚙️ Parameters",
+            value=(
+                "**Meanness (1-10):**\n"
+                "1 = Gentle and playful\n"
+                "10 = Absolutely savage\n\n"
+                "**Nerdiness (1-10):**\n"
+                "1 = Everyone can understand\n"
+                "10 = Extremely technical"
+            ),
+            inline=False
+        )
+
+        # Flavors section
+        flavors = self._flavors
+        embed.add_field(
+            name="🎯 Available Flavors",
+            value=", ".join([f"`{f}`" for f in flavors[:5]]) + f"\n...and {len(flavors) - 5} more! Use `{prefix}flavors` for full list",
+            inline=False
+        )
+
+        # Examples section
+        embed.add_field(
+            name="💡 Examples",
+            value=(
+                f"`{prefix}joke classic 7 1` - Classic fat/ugly jokes, pretty mean\n"
+                f"`{prefix}joke cybersecurity 8 9` - Savage cybersecurity roast\n"
+                f"`{prefix}joke linux 6 10` - Technical Linux joke\n"
+                f"`{prefix}random` - Surprise me!"
+            ),
+            inline=False
+        )
+
+        embed.set_footer(text="Powered by Google Gemini | Slash commands also available: /help")
+        return embed
+
     def _setup_events(self):
         """Setup Discord event handlers."""
         
         @self.bot.event
         async def on_ready():
             """Called when the bot is ready."""
-            logger.info(f'Discord bot logged in as {self.bot.user}')
-            logger.info(f'Bot is in {len(self.bot.guilds)} guilds')
+            logger.info('Discord bot logged in as %s', self.bot.user)
+            logger.info('Bot is in %d guilds', len(self.bot.guilds))
             
-            # Sync slash commands
+            # Sync slash commands. A guild-scoped sync propagates in
+            # seconds (global syncs take up to an hour), so development
+            # setups can point DISCORD_DEV_GUILD_ID at a test server.
+            # Unchanged command trees skip the sync RTT entirely.
             try:
-                synced = await self.bot.tree.sync()
-                logger.info(f'Synced {len(synced)} slash commands')
+                dev_guild = self.config.get_config('DISCORD_DEV_GUILD_ID')
+                sync_target = str(dev_guild) if dev_guild else 'global'
+                tree_hash = self._command_tree_hash()
+                if tree_hash is not None and (sync_target, tree_hash) == self._read_tree_hash():
+                    logger.info('Command tree unchanged, skipping sync')
+                elif dev_guild:
+                    guild = discord.Object(id=int(dev_guild))
+                    self.bot.tree.copy_global_to(guild=guild)
+                    synced = await self.bot.tree.sync(guild=guild)
+                    logger.info('Synced %d slash commands to dev guild %s', len(synced), dev_guild)
+                    self._write_tree_hash(sync_target, tree_hash)
+                else:
+                    synced = await self.bot.tree.sync()
+                    logger.info('Synced %d slash commands', len(synced))
+                    self._write_tree_hash(sync_target, tree_hash)
             except Exception as e:
-                logger.error(f'Failed to sync commands: {e}')
+                logger.error('Failed to sync commands: %s', e)
+
+            # Warm the Gemini connection in the background so the first
+            # real /joke doesn't pay the TLS handshake + first-request cost
+            asyncio.create_task(self._warmup())
         
         @self.bot.event
         async def on_command_error(ctx, error):
@@ -79,7 +425,7 @@ class DiscordBot:
             elif isinstance(error, commands.MissingRequiredArgument):
                 await ctx.send(f'❌ Missing argument: {error.param.name}')
             else:
-                logger.error(f'Command error: {error}')
+                logger.error('Command error: %s', error)
                 await ctx.send(f'❌ An error occurred: {str(error)}')
     
     def _setup_commands(self):
@@ -94,21 +440,8 @@ class DiscordBot:
             target="Custom target name (default: yo mama)",
             user="Mention a user to roast (optional)"
         )
-        @app_commands.choices(flavor=[
-            app_commands.Choice(name="🎭 Classic (Traditional Yo Mama)", value="classic"),
-            app_commands.Choice(name="🔒 Cybersecurity", value="cybersecurity"),
-            app_commands.Choice(name="💻 Tech (General Technology)", value="tech"),
-            app_commands.Choice(name="🐧 Linux", value="linux"),
-            app_commands.Choice(name="🌐 General", value="general"),
-            app_commands.Choice(name="🎮 Gaming", value="gaming"),
-            app_commands.Choice(name="👨‍💻 Programming", value="programming"),
-            app_commands.Choice(name="📡 Networking", value="networking"),
-            app_commands.Choice(name="☁️ Cloud", value="cloud"),
-            app_commands.Choice(name="🚀 DevOps", value="devops"),
-            app_commands.Choice(name="🗄️ Database", value="database"),
-            app_commands.Choice(name="📻 Amateur Radio (Ham Radio)", value="radio"),
-            app_commands.Choice(name="❓ Secret...", value="thegame"),  # Easter egg
-        ])
+        @app_commands.choices(flavor=list(_FLAVOR_CHOICES))
+        @_safe("Failed to generate joke")
         async def joke_slash(
             interaction: discord.Interaction,
             flavor: Optional[str] = None,
@@ -117,82 +450,90 @@ class DiscordBot:
             target: Optional[str] = None,
             user: Optional[discord.User] = None
         ):
-            await interaction.response.defer(thinking=True)
-            
-            try:
-                # Validate inputs
-                if meanness is not None and not (1 <= meanness <= 11):
-                    await interaction.followup.send("❌ Meanness must be between 1 and 11 (these go to eleven! 🎸)")
-                    return
-                
-                if nerdiness is not None and not (1 <= nerdiness <= 10):
-                    await interaction.followup.send("❌ Nerdiness must be between 1 and 10")
-                    return
-                
-                # Handle user mention (prepend to message)
-                mention_text = f"{user.mention} " if user else ""
-                
-                # Special handling for "thegame" Easter egg
-                if flavor == "thegame":
-                    joke = self.generator.generate_joke(
-                        flavor="thegame",
-                        meanness=11,  # THESE GO TO ELEVEN! 🎸
-                        nerdiness=meanness or 5,  # Use meanness as nerdiness for thegame
-                        target_name=user.display_name if user else (target or "you")
-                    )
-                    embed = discord.Embed(
-                        description=f"{mention_text}🎮💀 {joke}",
-                        color=discord.Color.purple()
-                    )
-                    embed.set_footer(text="You just lost The Game. Sorry! 😈")
-                else:
-                    # Generate normal joke
-                    joke = self.generator.generate_joke(
-                        flavor=flavor or self.config.default_flavor,
-                        meanness=meanness or self.config.default_meanness,
-                        nerdiness=nerdiness or self.config.default_nerdiness,
-                        target_name=user.display_name if user else target
-                    )
-                    
-                    # Create embed
-                    embed = discord.Embed(
-                        description=f"{mention_text}🎤 {joke}",
-                        color=discord.Color.red()
-                    )
-                    
-                    # Add footer with settings
-                    settings = []
-                    if flavor:
-                        settings.append(f"Flavor: {flavor}")
-                    settings.append(f"Meanness: {meanness or self.config.default_meanness}/10")
-                    settings.append(f"Nerdiness: {nerdiness or self.config.default_nerdiness}/10")
-                    embed.set_footer(text=" | ".join(settings))
-                
+            # Validate inputs (before deferring: a direct response is
+            # cheaper than a defer + followup pair)
+            if meanness is not None and not (1 <= meanness <= 11):
+                await interaction.response.send_message("❌ Meanness must be between 1 and 11 (these go to eleven! 🎸)")
+                return
+
+            if nerdiness is not None and not (1 <= nerdiness <= 10):
+                await interaction.response.send_message("❌ Nerdiness must be between 1 and 10")
+                return
+
+            # Defensive: Choices should prevent this, but don't pass
+            # unknown strings through to a Gemini call
+            if flavor and flavor.lower() not in _VALID_FLAVORS:
+                await interaction.response.send_message(f"❌ Unknown flavor '{flavor}'. Try /flavors")
+                return
+
+            # Handle user mention (prepend to message)
+            mention_text = f"{user.mention} " if user else ""
+
+            # Special handling for "thegame" Easter egg
+            if flavor == "thegame":
+                await interaction.response.defer(thinking=True)
+                joke = await self.generator.generate_joke_async(
+                    flavor="thegame",
+                    meanness=11,  # THESE GO TO ELEVEN! 🎸
+                    nerdiness=meanness or 5,  # Use meanness as nerdiness for thegame
+                    target_name=user.display_name if user else (target or "you")
+                )
+                await interaction.followup.send(
+                    embed=self._make_thegame_embed(joke, mention_text)
+                )
+                return
+
+            resolved = (
+                flavor or self._default_flavor,
+                meanness or self._default_meanness,
+                nerdiness or self._default_nerdiness,
+                user.display_name if user else target
+            )
+
+            # Pool hit: answer inside the 3-second interaction window
+            # directly, skipping the defer round trip entirely
+            joke = self._joke_pool.sample(resolved)
+            if joke is None:
+                await interaction.response.defer(thinking=True)
+                joke = await self.generator.generate_joke_async(
+                    flavor=resolved[0],
+                    meanness=resolved[1],
+                    nerdiness=resolved[2],
+                    target_name=resolved[3]
+                )
+                self._joke_pool.add(resolved, joke)
+
+            # Create embed
+            embed = self._make_joke_embed(joke, mention_text)
+
+            # Add footer with settings (single-pass join, no list)
+            embed.set_footer(text=" | ".join(filter(None, (
+                f"Flavor: {flavor}" if flavor else None,
+                f"Meanness: {resolved[1]}/10",
+                f"Nerdiness: {resolved[2]}/10",
+            ))))
+
+            if interaction.response.is_done():
                 await interaction.followup.send(embed=embed)
-                
-            except Exception as e:
-                logger.error(f"Error generating joke: {e}")
-                await interaction.followup.send(f"❌ Failed to generate joke: {str(e)}")
+            else:
+                await interaction.response.send_message(embed=embed)
+
         
         # Slash command: /random
         @self.bot.tree.command(name="random", description="Generate a random Yo Mama joke")
+        @_safe("Failed to generate joke")
         async def random_slash(interaction: discord.Interaction):
             await interaction.response.defer(thinking=True)
-            
-            try:
-                joke = self.generator.random_joke()
-                
-                embed = discord.Embed(
-                    description=f"🎲 {joke}",
-                    color=discord.Color.gold()
-                )
-                embed.set_footer(text="Random joke with random settings")
-                
-                await interaction.followup.send(embed=embed)
-                
-            except Exception as e:
-                logger.error(f"Error generating random joke: {e}")
-                await interaction.followup.send(f"❌ Failed to generate joke: {str(e)}")
+
+            joke = await self.generator.random_joke_async()
+
+            embed = discord.Embed(
+                description=f"🎲 {joke}",
+                color=discord.Color.gold()
+            )
+            embed.set_footer(text="Random joke with random settings")
+
+            await interaction.followup.send(embed=embed)
         
         # Slash command: /batch
         @self.bot.tree.command(name="batch", description="Generate multiple Yo Mama jokes")
@@ -202,21 +543,8 @@ class DiscordBot:
             meanness="How mean (1-11) - These go to eleven! 🎸",
             nerdiness="How nerdy (1-10)"
         )
-        @app_commands.choices(flavor=[
-            app_commands.Choice(name="🎭 Classic (Traditional Yo Mama)", value="classic"),
-            app_commands.Choice(name="🔒 Cybersecurity", value="cybersecurity"),
-            app_commands.Choice(name="💻 Tech (General Technology)", value="tech"),
-            app_commands.Choice(name="🐧 Linux", value="linux"),
-            app_commands.Choice(name="🌐 General", value="general"),
-            app_commands.Choice(name="🎮 Gaming", value="gaming"),
-            app_commands.Choice(name="👨‍💻 Programming", value="programming"),
-            app_commands.Choice(name="📡 Networking", value="networking"),
-            app_commands.Choice(name="☁️ Cloud", value="cloud"),
-            app_commands.Choice(name="🚀 DevOps", value="devops"),
-            app_commands.Choice(name="🗄️ Database", value="database"),
-            app_commands.Choice(name="📻 Amateur Radio (Ham Radio)", value="radio"),
-            app_commands.Choice(name="❓ Secret...", value="thegame"),  # Easter egg
-        ])
+        @app_commands.choices(flavor=list(_FLAVOR_CHOICES))
+        @_safe("Failed to generate jokes")
         async def batch_slash(
             interaction: discord.Interaction,
             count: int = 3,
@@ -225,164 +553,85 @@ class DiscordBot:
             nerdiness: Optional[int] = None
         ):
             await interaction.response.defer(thinking=True)
+
+            # Validate count
+            if not (1 <= count <= 10):
+                await interaction.followup.send("❌ Count must be between 1 and 10")
+                return
             
-            try:
-                # Validate count
-                if not (1 <= count <= 10):
-                    await interaction.followup.send("❌ Count must be between 1 and 10")
-                    return
-                
-                # Generate jokes
-                jokes = self.generator.generate_batch(
-                    count=count,
-                    flavor=flavor or self.config.default_flavor,
-                    meanness=meanness or self.config.default_meanness,
-                    nerdiness=nerdiness or self.config.default_nerdiness
-                )
-                
-                # Create embed
-                embed = discord.Embed(
-                    title=f"🔥 {count} Yo Mama Jokes",
-                    color=discord.Color.red()
-                )
-                
+            # Generate jokes concurrently (bounded by the generator's
+            # semaphore) instead of serializing N Gemini round trips
+            jokes = await self.generator.generate_batch_async(
+                count=count,
+                flavor=flavor or self._default_flavor,
+                meanness=meanness or self._default_meanness,
+                nerdiness=nerdiness or self._default_nerdiness
+            )
+            
+            # Create embed: one joined description instead of N
+            # add_field calls (smaller payload too); fall back to
+            # fields if the 4096-char description limit would trip
+            embed = discord.Embed(
+                title=f"🔥 {count} Yo Mama Jokes",
+                color=discord.Color.red()
+            )
+
+            description = "\n\n".join(
+                f"**#{i}** {joke}" for i, joke in enumerate(jokes, 1)
+            )
+            if len(description) <= 4096:
+                embed.description = description
+            else:
                 for i, joke in enumerate(jokes, 1):
                     embed.add_field(
                         name=f"#{i}",
                         value=joke,
                         inline=False
                     )
-                
-                # Add footer
-                settings = []
-                if flavor:
-                    settings.append(f"Flavor: {flavor}")
-                settings.append(f"M: {meanness or self.config.default_meanness}")
-                settings.append(f"N: {nerdiness or self.config.default_nerdiness}")
-                embed.set_footer(text=" | ".join(settings))
-                
-                await interaction.followup.send(embed=embed)
-                
-            except Exception as e:
-                logger.error(f"Error generating batch: {e}")
-                await interaction.followup.send(f"❌ Failed to generate jokes: {str(e)}")
+            
+            # Add footer (single-pass join, no list)
+            embed.set_footer(text=" | ".join(filter(None, (
+                f"Flavor: {flavor}" if flavor else None,
+                f"M: {meanness or self._default_meanness}",
+                f"N: {nerdiness or self._default_nerdiness}",
+            ))))
+            
+            await interaction.followup.send(embed=embed)
+            
         
         # Slash command: /flavors
         @self.bot.tree.command(name="flavors", description="List available joke flavors")
         async def flavors_slash(interaction: discord.Interaction):
-            flavors = YoMamaGenerator.list_flavors()
-            
-            embed = discord.Embed(
-                title="📋 Available Joke Flavors",
-                description="\n".join([f"• `{flavor}`" for flavor in flavors]),
-                color=discord.Color.blue()
-            )
-            
-            await interaction.response.send_message(embed=embed)
+            await interaction.response.send_message(embed=self._flavors_embed)
         
         # Slash command: /help
         @self.bot.tree.command(name="help", description="Show help for Yo Mama Bot")
         async def help_slash(interaction: discord.Interaction):
-            embed = discord.Embed(
-                title="🎤 Yo Mama Bot - Help",
-                description="AI-powered Yo Mama joke generator with customizable meanness and nerdiness!",
-                color=discord.Color.purple()
-            )
-            
-            # Commands section
-            embed.add_field(
-                name="📝 Slash Commands",
-                value=(
-                    "`/joke [flavor] [meanness] [nerdiness] [target]`\n"
-                    "Generate a custom Yo Mama joke\n\n"
-                    "`/random`\n"
-                    "Generate a completely random joke\n\n"
-                    "`/batch [count] [flavor] [meanness] [nerdiness]`\n"
-                    "Generate multiple jokes (1-10)\n\n"
-                    "`/flavors`\n"
-                    "List all available joke flavors\n\n"
-                    "`/help`\n"
-                    "Show this help message"
-                ),
-                inline=False
-            )
-            
-            # Parameters section
-            embed.add_field(
-                name="⚙️ Parameters",
-                value=(
-                    "**Meanness (1-10):**\n"
-                    "1 = Gentle and playful\n"
-                    "10 = Absolutely savage\n\n"
-                    "**Nerdiness (1-10):**\n"
-                    "1 = Everyone can understand\n"
-                    "10 = Extremely technical"
-                ),
-                inline=False
-            )
-            
-            # Flavors section
-            flavors = YoMamaGenerator.list_flavors()
-            flavor_list = [
-                "🎭 `classic` - Traditional Yo Mama jokes",
-                "🔒 `cybersecurity` - Hacking & security",
-                "💻 `tech` - General technology",
-                "🐧 `linux` - Linux & Unix",
-                "🌐 `general` - Everyday tech",
-                "🎮 `gaming` - Video games",
-                "👨‍💻 `programming` - Coding",
-                "📡 `networking` - Networks",
-                "☁️ `cloud` - Cloud computing",
-                "🚀 `devops` - DevOps & CI/CD",
-                "🗄️ `database` - Databases",
-                "📻 `radio` - Amateur radio / Ham radio"
-            ]
-            embed.add_field(
-                name="🎯 Available Flavors",
-                value="\n".join(flavor_list),
-                inline=False
-            )
-            
-            # Examples section
-            embed.add_field(
-                name="💡 Examples",
-                value=(
-                    "`/joke classic 7 1` - Classic fat/ugly jokes, pretty mean, easy to understand\n"
-                    "`/joke cybersecurity 8 9` - Savage cybersecurity roast\n"
-                    "`/joke linux 6 10` - Technical Linux joke\n"
-                    "`/random` - Surprise me!\n"
-                    "`/batch 3 tech 5 5` - Generate 3 tech jokes"
-                ),
-                inline=False
-            )
-            
-            embed.set_footer(text=f"Prefix: {self.bot.command_prefix} | Powered by Google Gemini")
-            
-            await interaction.response.send_message(embed=embed)
+            await interaction.response.send_message(embed=self._help_embed_slash)
         
         # Text command: !joke (for backwards compatibility)
         @self.bot.command(name='joke')
         async def joke_text(ctx, flavor: Optional[str] = None, meanness: int = 5, nerdiness: int = 5):
             """Generate a Yo Mama joke (text command)"""
+            # Cheap O(1) rejection before any typing indicator or LLM call
+            if flavor and flavor.lower() not in _VALID_FLAVORS:
+                await ctx.send(f"❌ Unknown flavor '{flavor}'. Try {self.bot.command_prefix}flavors")
+                return
+
             async with ctx.typing():
                 try:
-                    logger.info(f"Text command received: flavor='{flavor}', type={type(flavor)}")
+                    logger.info("Text command received: flavor=%r, type=%s", flavor, type(flavor).__name__)
                     # Special handling for "thegame" Easter egg
                     if flavor and flavor.lower() == "thegame":
-                        joke = self.generator.generate_joke(
+                        joke = await self.generator.generate_joke_async(
                             flavor="thegame",
                             meanness=10,  # Always maximum savage
                             nerdiness=5,
                             target_name=None
                         )
-                        embed = discord.Embed(
-                            description=f"🎮💀 {joke}",
-                            color=discord.Color.purple()
-                        )
-                        embed.set_footer(text="You just lost The Game. Sorry! 😈")
-                        await ctx.send(embed=embed)
+                        await ctx.send(embed=self._make_thegame_embed(joke))
                     else:
-                        joke = self.generator.generate_joke(
+                        joke = await self.generator.generate_joke_async(
                             flavor=flavor,
                             meanness=meanness,
                             nerdiness=nerdiness
@@ -397,7 +646,7 @@ class DiscordBot:
             """Generate a random joke (text command)"""
             async with ctx.typing():
                 try:
-                    joke = self.generator.random_joke()
+                    joke = await self.generator.random_joke_async()
                     await ctx.send(f"🎲 {joke}")
                 except Exception as e:
                     await ctx.send(f"❌ Error: {str(e)}")
@@ -408,18 +657,13 @@ class DiscordBot:
             """You just lost The Game! (Easter egg)"""
             async with ctx.typing():
                 try:
-                    joke = self.generator.generate_joke(
+                    joke = await self.generator.generate_joke_async(
                         flavor="thegame",
                         meanness=11,  # THESE GO TO ELEVEN! 🎸
                         nerdiness=5,
                         target_name=None
                     )
-                    embed = discord.Embed(
-                        description=f"🎮💀 {joke}",
-                        color=discord.Color.purple()
-                    )
-                    embed.set_footer(text="You just lost The Game. Sorry! 😈")
-                    await ctx.send(embed=embed)
+                    await ctx.send(embed=self._make_thegame_embed(joke))
                 except Exception as e:
                     await ctx.send(f"❌ Error: {str(e)}")
         
@@ -427,74 +671,13 @@ class DiscordBot:
         @self.bot.command(name='help')
         async def help_text(ctx):
             """Show help information (text command)"""
-            embed = discord.Embed(
-                title="🎤 Yo Mama Bot - Help",
-                description="AI-powered Yo Mama joke generator with customizable meanness and nerdiness!",
-                color=discord.Color.purple()
-            )
-            
-            prefix = self.bot.command_prefix
-            
-            # Commands section
-            embed.add_field(
-                name="📝 Text Commands",
-                value=(
-                    f"`{prefix}joke [flavor] [meanness] [nerdiness]`\n"
-                    "Generate a custom Yo Mama joke\n\n"
-                    f"`{prefix}random`\n"
-                    "Generate a completely random joke\n\n"
-                    f"`{prefix}flavors`\n"
-                    "List all available joke flavors\n\n"
-                    f"`{prefix}help`\n"
-                    "Show this help message"
-                ),
-                inline=False
-            )
-            
-            # Parameters section
-            embed.add_field(
-                name="⚙️ Parameters",
-                value=(
-                    "**Meanness (1-10):**\n"
-                    "1 = Gentle and playful\n"
-                    "10 = Absolutely savage\n\n"
-                    "**Nerdiness (1-10):**\n"
-                    "1 = Everyone can understand\n"
-                    "10 = Extremely technical"
-                ),
-                inline=False
-            )
-            
-            # Flavors section
-            flavors = YoMamaGenerator.list_flavors()
-            embed.add_field(
-                name="🎯 Available Flavors",
-                value=", ".join([f"`{f}`" for f in flavors[:5]]) + f"\n...and {len(flavors) - 5} more! Use `{prefix}flavors` for full list",
-                inline=False
-            )
-            
-            # Examples section
-            embed.add_field(
-                name="💡 Examples",
-                value=(
-                    f"`{prefix}joke classic 7 1` - Classic fat/ugly jokes, pretty mean\n"
-                    f"`{prefix}joke cybersecurity 8 9` - Savage cybersecurity roast\n"
-                    f"`{prefix}joke linux 6 10` - Technical Linux joke\n"
-                    f"`{prefix}random` - Surprise me!"
-                ),
-                inline=False
-            )
-            
-            embed.set_footer(text=f"Powered by Google Gemini | Slash commands also available: /help")
-            
-            await ctx.send(embed=embed)
+            await ctx.send(embed=self._help_embed_text)
         
         # Text command: !flavors
         @self.bot.command(name='flavors')
         async def flavors_text(ctx):
             """List available flavors (text command)"""
-            flavors = YoMamaGenerator.list_flavors()
-            await ctx.send(f"📋 Available flavors:\n" + ", ".join(flavors))
+            await ctx.send(f"📋 Available flavors:\n" + ", ".join(self._flavors))
     
     def run(self):
         """Run the Discord bot."""
@@ -517,7 +700,11 @@ class DiscordBot:
             settings: Optional dict with flavor, meanness, nerdiness
         """
         try:
-            webhook = discord.Webhook.from_url(webhook_url, session=None)
+            if self._http_session is None or self._http_session.closed:
+                self._http_session = aiohttp.ClientSession(
+                    connector=aiohttp.TCPConnector(limit=100, ttl_dns_cache=300)
+                )
+            webhook = discord.Webhook.from_url(webhook_url, session=self._http_session)
             
             embed = discord.Embed(
                 description=f"🎤 {joke}",
@@ -525,44 +712,88 @@ class DiscordBot:
             )
             
             if settings:
-                footer_parts = []
-                if 'flavor' in settings:
-                    footer_parts.append(f"Flavor: {settings['flavor']}")
-                if 'meanness' in settings:
-                    footer_parts.append(f"M: {settings['meanness']}/10")
-                if 'nerdiness' in settings:
-                    footer_parts.append(f"N: {settings['nerdiness']}/10")
-                
-                if footer_parts:
-                    embed.set_footer(text=" | ".join(footer_parts))
+                footer = " | ".join(filter(None, (
+                    f"Flavor: {settings['flavor']}" if 'flavor' in settings else None,
+                    f"M: {settings['meanness']}/10" if 'meanness' in settings else None,
+                    f"N: {settings['nerdiness']}/10" if 'nerdiness' in settings else None,
+                )))
+                if footer:
+                    embed.set_footer(text=footer)
             
             await webhook.send(embed=embed, username="Yo Mama Bot")
             logger.info("Posted joke to webhook")
             
         except Exception as e:
-            logger.error(f"Failed to post to webhook: {e}")
+            logger.error("Failed to post to webhook: %s", e)
             raise
 
+    async def post_to_webhooks(
+        self,
+        urls: list[str],
+        joke: str,
+        settings: Optional[dict] = None,
+        concurrency: int = 8
+    ) -> list:
+        """
+        Post a joke to several webhooks concurrently.
+
+        Overlaps the TLS+POST round trips (bounded by concurrency) so a
+        burst of N posts takes roughly the slowest RTT instead of the
+        sum. Failures are logged per URL without aborting the rest.
+
+        Returns:
+            Per-URL results in input order (None on success, the
+            exception instance on failure).
+        """
+        sem = asyncio.Semaphore(concurrency)
+
+        async def one(url: str):
+            async with sem:
+                return await self.post_to_webhook(url, joke, settings)
+
+        results = await asyncio.gather(
+            *(one(url) for url in urls),
+            return_exceptions=True
+        )
+        for url, result in zip(urls, results):
+            if isinstance(result, Exception):
+                logger.error("Webhook post failed for %s: %s", url, result)
+        return results
+
+    async def aclose(self):
+        """Close the shared webhook HTTP session (call on shutdown)."""
+        if self._http_session is not None and not self._http_session.closed:
+            await self._http_session.close()
+
 
 # Standalone function to run the bot
-def run_discord_bot():
-    """Run the Discord bot standalone."""
+def run_discord_bot(generator=None):
+    """Run the Discord bot standalone (optionally with a shared generator)."""
     import sys
-    
+
+    # Use uvloop where available (Linux/macOS): noticeably faster socket
+    # and timer handling for the gateway/REST hot path. bot.run() calls
+    # asyncio.run internally, which picks up the installed policy.
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
     # Setup logging
     logging.basicConfig(
         level=logging.INFO,
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     )
-    
+
     try:
-        bot = DiscordBot()
+        bot = DiscordBot(generator=generator)
         bot.run()
     except KeyboardInterrupt:
         logger.info("Bot stopped by user")
         sys.exit(0)
     except Exception as e:
-        logger.error(f"Bot crashed: {e}")
+        logger.error("Bot crashed: %s", e)
         sys.exit(1)
 
 
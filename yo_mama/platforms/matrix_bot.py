@@ -8,13 +8,60 @@ Supports Matrix rooms and commands.
 
 import logging
 import asyncio
+import sys
+from collections import namedtuple
 from typing import Optional
+try:
+    # Cheaper than asyncio.wait_for for single-future waits
+    from async_timeout import timeout
+except ImportError:
+    # Python 3.11+ ships the same implementation in the stdlib
+    from asyncio import timeout
+
 from nio import AsyncClient, MatrixRoom, RoomMessageText, InviteEvent
+from ..cache import JokePool
 from ..config import get_config
+from ..secrets import get_secrets_for_platform
 from ..yo_mama_generator import YoMamaGenerator
 
 logger = logging.getLogger(__name__)
 
+# Flavor list is fixed at import time; avoid re-calling the classmethod
+_FLAVORS = YoMamaGenerator.list_flavors()
+
+# Minimal stand-in for a MatrixRoom when only the room_id is known,
+# so send_joke_to_room can reuse _send_message
+_RoomStub = namedtuple('_RoomStub', ['room_id'])
+
+# Constant parts of the room_send content dicts, merged per message
+_HTML_CONTENT_TEMPLATE = {
+    "msgtype": "m.text",
+    "format": "org.matrix.custom.html",
+}
+
+_HELP_TEXT = """
+🎤 <b>Yo Mama Bot - Help</b>
+
+<b>Commands:</b>
+• <code>!joke [flavor] [meanness] [nerdiness]</code> - Generate a joke
+  Example: <code>!joke cybersecurity 8 9</code>
+
+• <code>!random</code> - Generate a random joke
+
+• <code>!batch [count] [flavor]</code> - Generate multiple jokes
+  Example: <code>!batch 5 tech</code>
+
+• <code>!flavors</code> - List available flavors
+
+• <code>!help</code> - Show this help message
+
+<b>Parameters:</b>
+• Meanness: 1-10 (1=gentle, 10=brutal)
+• Nerdiness: 1-10 (1=accessible, 10=very technical)
+
+<b>Flavors:</b> cybersecurity, tech, linux, gaming, programming, networking, cloud, devops, database, general
+"""
+
 
 class MatrixBot:
     """
@@ -28,20 +75,34 @@ class MatrixBot:
     - !help - Show help message
     """
     
-    def __init__(self, config=None):
-        """Initialize the Matrix bot."""
+    def __init__(self, config=None, generator=None):
+        """
+        Initialize the Matrix bot.
+
+        Args:
+            config: Optional Config instance (default: global config)
+            generator: Optional shared YoMamaGenerator. Pass the same
+                       instance to multiple bots to share the Gemini
+                       client connection and joke cache.
+        """
         self.config = config or get_config()
+        self._shared_generator = generator
         
-        # Get Matrix configuration
-        self.homeserver = self.config.get_secret('MATRIX_HOMESERVER', 'https://matrix.org')
+        # Get Matrix configuration in one batched lookup (one backend
+        # fetch per enabled secrets manager instead of one per key)
+        matrix_secrets = get_secrets_for_platform(
+            'matrix',
+            ['homeserver', 'user_id', 'access_token', 'password', 'device_id']
+        )
+        self.homeserver = matrix_secrets['homeserver'] or 'https://matrix.org'
         # Ensure homeserver URL has a protocol
         if not self.homeserver.startswith(('http://', 'https://')):
             self.homeserver = f'https://{self.homeserver}'
-        
-        self.user_id = self.config.get_secret('MATRIX_USER_ID')
-        self.access_token = self.config.get_secret('MATRIX_ACCESS_TOKEN')
-        self.password = self.config.get_secret('MATRIX_PASSWORD')
-        self.device_id = self.config.get_secret('MATRIX_DEVICE_ID', 'yo_mama_bot')
+
+        self.user_id = matrix_secrets['user_id']
+        self.access_token = matrix_secrets['access_token']
+        self.password = matrix_secrets['password']
+        self.device_id = matrix_secrets['device_id'] or 'yo_mama_bot'
         
         # Require either access token OR username+password
         if not self.user_id:
@@ -49,6 +110,10 @@ class MatrixBot:
         
         if not self.access_token and not self.password:
             raise ValueError("Either MATRIX_ACCESS_TOKEN or MATRIX_PASSWORD is required")
+
+        # Intern our own user ID so the per-message echo check below can
+        # usually short-circuit on an identity compare
+        self.user_id = sys.intern(self.user_id)
         
         # Initialize Matrix client
         self.client = AsyncClient(
@@ -64,13 +129,39 @@ class MatrixBot:
         else:
             self.use_password_login = True
         
-        # Initialize joke generator
-        self.generator = YoMamaGenerator(
+        # Initialize joke generator (or reuse a shared one)
+        self.generator = self._shared_generator or YoMamaGenerator(
             api_key=self.config.gemini_api_key,
             model_name=self.config.gemini_model
         )
         self.prefix = self.config.get_config('MATRIX_PREFIX', '!')
-        
+        self._prefix_len = len(self.prefix)
+        self._prefix_first = self.prefix[0]
+
+        # Command dispatch table: one dict lookup per message instead of
+        # an if/elif chain. All handlers share the (room, args) signature.
+        self._commands = {
+            'joke': self._cmd_joke,
+            'random': self._cmd_random,
+            'batch': self._cmd_batch,
+            'flavors': self._cmd_flavors,
+            'help': self._cmd_help,
+            'thegame': self._cmd_thegame,
+        }
+
+        # Recent jokes per parameter tuple; lets simultaneous !joke spam
+        # across rooms reuse results instead of all hitting Gemini
+        self._joke_pool = JokePool()
+
+        # Static !flavors / !help payloads never change after startup, so
+        # build the message (and its <br/>-formatted HTML body) once
+        self._flavors_msg = "📋 <b>Available Flavors:</b>\n" + "\n".join(
+            f"• {flavor}" for flavor in _FLAVORS
+        )
+        self._flavors_msg_html = self._flavors_msg.replace('\n', '<br/>')
+        self._help_msg = _HELP_TEXT.strip()
+        self._help_msg_html = self._help_msg.replace('\n', '<br/>')
+
         # Auto-join rooms
         self.auto_join = self.config.get_bool('MATRIX_AUTO_JOIN', True)
         
@@ -100,68 +191,78 @@ class MatrixBot:
     
     async def _handle_message(self, room: MatrixRoom, event: RoomMessageText):
         """Handle incoming messages."""
-        # Ignore our own messages
-        if event.sender == self.user_id:
+        # Ignore our own messages (identity compare first; falls back to
+        # the full string compare when nio hands us a non-interned sender)
+        sender = event.sender
+        if sender is self.user_id or sender == self.user_id:
             return
         
-        message = event.body.strip()
-        
+        # Cheapest rejection first: nearly all room traffic is ordinary
+        # chatter, so test the first character before paying for strip().
+        # Leading whitespace can still hide the prefix, so only reject
+        # when the first character is neither the prefix nor whitespace.
+        body = event.body
+        if not body or (body[0] != self._prefix_first and not body[0].isspace()):
+            return
+
+        message = body.strip()
+
         # Check if message starts with prefix
         if not message.startswith(self.prefix):
             return
         
-        # Parse command
-        parts = message[len(self.prefix):].split()
-        if not parts:
+        # Parse just the command word; handlers that take arguments split
+        # the rest themselves, so ordinary dispatch never tokenizes the
+        # whole message
+        head, _, rest = message[self._prefix_len:].partition(' ')
+        if not head:
             return
-        
-        command = parts[0].lower()
-        args = parts[1:]
-        
+
+        command = head.lower()
+
         logger.info(f"Command '{command}' from {event.sender} in {room.room_id}")
-        
+
         # Route commands
         try:
-            if command == 'joke':
-                await self._cmd_joke(room, args)
-            elif command == 'random':
-                await self._cmd_random(room)
-            elif command == 'batch':
-                await self._cmd_batch(room, args)
-            elif command == 'flavors':
-                await self._cmd_flavors(room)
-            elif command == 'help':
-                await self._cmd_help(room)
-            elif command == 'thegame':
-                await self._cmd_thegame(room, args)
+            handler = self._commands.get(command)
+            if handler:
+                await handler(room, rest)
             else:
                 await self._send_message(room, f"Unknown command: {command}. Try !help")
         except Exception as e:
             logger.error(f"Error handling command: {e}")
             await self._send_message(room, f"❌ Error: {str(e)}")
     
-    async def _cmd_joke(self, room: MatrixRoom, args: list):
+    async def _cmd_joke(self, room: MatrixRoom, rest: str = ''):
         """Handle !joke command."""
         # Parse arguments: [flavor] [meanness] [nerdiness]
+        args = rest.split(None, 3)
         flavor = args[0] if len(args) > 0 else None
         meanness = int(args[1]) if len(args) > 1 else self.config.default_meanness
         nerdiness = int(args[2]) if len(args) > 2 else self.config.default_nerdiness
         
-        # Validate
-        if meanness < 1 or meanness > 11:
-            await self._send_message(room, "❌ Meanness must be between 1 and 11 (these go to eleven! 🎸)")
-            return
-        
-        if nerdiness < 1 or nerdiness > 10:
-            await self._send_message(room, "❌ Nerdiness must be between 1 and 10")
+        # Validate both ranges up front; the happy path pays no
+        # error-string formatting and the error path disambiguates
+        if not (1 <= meanness <= 11 and 1 <= nerdiness <= 10):
+            if meanness < 1 or meanness > 11:
+                await self._send_message(room, "❌ Meanness must be between 1 and 11 (these go to eleven! 🎸)")
+            else:
+                await self._send_message(room, "❌ Nerdiness must be between 1 and 10")
             return
         
-        # Generate joke (no "generating" message to avoid leaving error messages)
-        joke = self.generator.generate_joke(
-            flavor=flavor,
-            meanness=meanness,
-            nerdiness=nerdiness
-        )
+        # Generate joke (no "generating" message to avoid leaving error
+        # messages); the async variant keeps the sync loop responsive for
+        # other rooms while Gemini responds. The pool sometimes serves a
+        # recent joke for the same parameters instead of a fresh API call.
+        key = (flavor, meanness, nerdiness)
+        joke = self._joke_pool.sample(key)
+        if joke is None:
+            joke = await self.generator.generate_joke_async(
+                flavor=flavor,
+                meanness=meanness,
+                nerdiness=nerdiness
+            )
+            self._joke_pool.add(key, joke)
         
         # Format message
         settings = f"[Flavor: {flavor or 'random'}, M: {meanness}/10, N: {nerdiness}/10]"
@@ -169,25 +270,26 @@ class MatrixBot:
         
         await self._send_message(room, message, html=True)
     
-    async def _cmd_random(self, room: MatrixRoom):
+    async def _cmd_random(self, room: MatrixRoom, rest: str = ''):
         """Handle !random command."""
-        joke = self.generator.random_joke()
+        joke = await self.generator.random_joke_async()
         await self._send_message(room, f"🎲 {joke}")
     
-    async def _cmd_thegame(self, room: MatrixRoom, args: list = None):
+    async def _cmd_thegame(self, room: MatrixRoom, rest: str = ''):
         """Handle !thegame command (Easter egg)."""
         # Extract user mention if provided (Matrix format: @user:server.com)
         target_name = None
         mention_text = ""
-        
-        if args and len(args) > 0:
+
+        args = rest.split(None, 1)
+        if args:
             # Check if it's a Matrix user mention
             if args[0].startswith('@'):
                 # Use "you" to directly address the mentioned user
                 target_name = "you"
                 mention_text = f"{args[0]} "
         
-        joke = self.generator.generate_joke(
+        joke = await self.generator.generate_joke_async(
             flavor="thegame",
             meanness=11,  # THESE GO TO ELEVEN! 🎸
             nerdiness=5,
@@ -196,9 +298,10 @@ class MatrixBot:
         
         await self._send_message(room, f"{mention_text}🎮💀 {joke}\n\n_You just lost The Game. Sorry! 😈_")
     
-    async def _cmd_batch(self, room: MatrixRoom, args: list):
+    async def _cmd_batch(self, room: MatrixRoom, rest: str = ''):
         """Handle !batch command."""
         # Parse arguments: [count] [flavor]
+        args = rest.split(None, 2)
         try:
             count = int(args[0]) if len(args) > 0 else 3
         except ValueError:
@@ -210,10 +313,13 @@ class MatrixBot:
             return
         
         flavor = args[1] if len(args) > 1 else None
+
+        # Small batches finish fast enough that the status message is just
+        # an extra round-trip; only announce the long-running ones
+        if count > 3:
+            await self._send_message(room, f"🔥 Generating {count} jokes...")
         
-        await self._send_message(room, f"🔥 Generating {count} jokes...")
-        
-        jokes = self.generator.generate_batch(
+        jokes = await self.generator.generate_batch_async(
             count=count,
             flavor=flavor,
             meanness=self.config.default_meanness,
@@ -228,49 +334,31 @@ class MatrixBot:
         message = "\n".join(message_parts)
         await self._send_message(room, message, html=True)
     
-    async def _cmd_flavors(self, room: MatrixRoom):
+    async def _cmd_flavors(self, room: MatrixRoom, rest: str = ''):
         """Handle !flavors command."""
-        flavors = YoMamaGenerator.list_flavors()
-        message = "📋 <b>Available Flavors:</b>\n" + "\n".join([f"• {flavor}" for flavor in flavors])
-        await self._send_message(room, message, html=True)
-    
-    async def _cmd_help(self, room: MatrixRoom):
-        """Handle !help command."""
-        help_text = """
-🎤 <b>Yo Mama Bot - Help</b>
-
-<b>Commands:</b>
-• <code>!joke [flavor] [meanness] [nerdiness]</code> - Generate a joke
-  Example: <code>!joke cybersecurity 8 9</code>
+        await self._send_message(room, self._flavors_msg, html=True,
+                                 formatted_body=self._flavors_msg_html)
 
-• <code>!random</code> - Generate a random joke
-
-• <code>!batch [count] [flavor]</code> - Generate multiple jokes
-  Example: <code>!batch 5 tech</code>
-
-• <code>!flavors</code> - List available flavors
-
-• <code>!help</code> - Show this help message
-
-<b>Parameters:</b>
-• Meanness: 1-10 (1=gentle, 10=brutal)
-• Nerdiness: 1-10 (1=accessible, 10=very technical)
+    async def _cmd_help(self, room: MatrixRoom, rest: str = ''):
+        """Handle !help command."""
+        await self._send_message(room, self._help_msg, html=True,
+                                 formatted_body=self._help_msg_html)
 
-<b>Flavors:</b> cybersecurity, tech, linux, gaming, programming, networking, cloud, devops, database, general
-        """
-        await self._send_message(room, help_text.strip(), html=True)
-    
-    async def _send_message(self, room: MatrixRoom, message: str, html: bool = False):
+    async def _send_message(self, room: MatrixRoom, message: str, html: bool = False,
+                            formatted_body: Optional[str] = None):
         """Send a message to a room."""
         try:
             if html:
-                # Convert markdown-style formatting to HTML
-                html_message = message.replace('\n', '<br/>')
+                # Convert markdown-style formatting to HTML (callers with a
+                # static payload pass the precomputed formatted_body); skip
+                # the replace() scan entirely for single-line messages
+                if formatted_body is None:
+                    needs_br = '\n' in message
+                    formatted_body = message.replace('\n', '<br/>') if needs_br else message
                 content = {
-                    "msgtype": "m.text",
+                    **_HTML_CONTENT_TEMPLATE,
                     "body": message,
-                    "format": "org.matrix.custom.html",
-                    "formatted_body": html_message
+                    "formatted_body": formatted_body
                 }
             else:
                 content = {
@@ -278,11 +366,12 @@ class MatrixBot:
                     "body": message
                 }
             
-            await self.client.room_send(
-                room_id=room.room_id,
-                message_type="m.room.message",
-                content=content
-            )
+            async with timeout(10):
+                await self.client.room_send(
+                    room_id=room.room_id,
+                    message_type="m.room.message",
+                    content=content
+                )
         except Exception as e:
             logger.error(f"Failed to send message: {e}")
     
@@ -295,39 +384,22 @@ class MatrixBot:
             joke: The joke to send
             settings: Optional dict with flavor, meanness, nerdiness
         """
-        try:
-            message = f"🎤 {joke}"
-            
-            if settings:
-                parts = []
-                if 'flavor' in settings:
-                    parts.append(f"Flavor: {settings['flavor']}")
-                if 'meanness' in settings:
-                    parts.append(f"M: {settings['meanness']}/10")
-                if 'nerdiness' in settings:
-                    parts.append(f"N: {settings['nerdiness']}/10")
-                
-                if parts:
-                    message += f"\n\n<i>[{' | '.join(parts)}]</i>"
-            
-            content = {
-                "msgtype": "m.text",
-                "body": joke,
-                "format": "org.matrix.custom.html",
-                "formatted_body": message.replace('\n', '<br/>')
-            }
-            
-            await self.client.room_send(
-                room_id=room_id,
-                message_type="m.room.message",
-                content=content
-            )
-            
-            logger.info(f"Sent joke to room {room_id}")
-            
-        except Exception as e:
-            logger.error(f"Failed to send joke to room: {e}")
-            raise
+        message = f"🎤 {joke}"
+
+        if settings:
+            parts = []
+            if 'flavor' in settings:
+                parts.append(f"Flavor: {settings['flavor']}")
+            if 'meanness' in settings:
+                parts.append(f"M: {settings['meanness']}/10")
+            if 'nerdiness' in settings:
+                parts.append(f"N: {settings['nerdiness']}/10")
+
+            if parts:
+                message += f"\n\n<i>[{' | '.join(parts)}]</i>"
+
+        await self._send_message(_RoomStub(room_id), message, html=True)
+        logger.info(f"Sent joke to room {room_id}")
     
     async def start(self):
         """Start the Matrix bot."""
@@ -357,22 +429,28 @@ class MatrixBot:
     
     def run(self):
         """Run the Matrix bot (blocking)."""
+        # Use uvloop where available (Linux/macOS): the sync loop is pure
+        # async I/O, so the faster event loop directly lifts throughput
+        try:
+            import uvloop
+            uvloop.install()
+        except ImportError:
+            pass
+
         asyncio.run(self.start())
 
 
 # Standalone function to run the bot
-def run_matrix_bot():
-    """Run the Matrix bot standalone."""
-    import sys
-    
+def run_matrix_bot(generator=None):
+    """Run the Matrix bot standalone (optionally with a shared generator)."""
     # Setup logging
     logging.basicConfig(
         level=logging.INFO,
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     )
-    
+
     try:
-        bot = MatrixBot()
+        bot = MatrixBot(generator=generator)
         bot.run()
     except KeyboardInterrupt:
         logger.info("Bot stopped by user")
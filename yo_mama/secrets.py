@@ -11,14 +11,69 @@ Priority order for secrets:
 5. Default values - LAST RESORT
 """
 
+import functools
 import os
 import json
 import logging
+import time
 from typing import Optional, Dict, Any
 
 logger = logging.getLogger(__name__)
 
+# TTL cache for the load_secrets_from_* functions. A single get_secret()
+# call can hit Doppler twice (prefixed + direct lookup) and config loading
+# repeats that per key, so without caching every startup pays dozens of
+# identical network round-trips for the same bundle.
+_cache: dict[tuple, tuple[float, dict]] = {}
+_TTL = 300  # seconds
 
+# Backend SDK clients, constructed lazily on first use and reused: the
+# first AWS/Vault call pays a TLS handshake and the Doppler SDK validates
+# its token, none of which need repeating per lookup. Vault and Doppler
+# are keyed by their credentials so token rotation still takes effect.
+_boto_client = None
+_vault_clients: dict[tuple, Any] = {}
+_doppler_sdks: dict[str, Any] = {}
+
+
+def _ttl_cache(func):
+    """Cache a secrets loader's result for _TTL seconds.
+
+    The key includes the relevant environment variables so switching
+    Doppler project/config or Vault URL mid-process is still picked up.
+    """
+    @functools.wraps(func)
+    def wrapper(*args):
+        key = (
+            func.__name__,
+            args,
+            os.getenv('DOPPLER_PROJECT'),
+            os.getenv('DOPPLER_CONFIG'),
+            os.getenv('SECRETS_VAULT_URL'),
+        )
+        cached = _cache.get(key)
+        now = time.monotonic()
+        if cached is not None and now - cached[0] < _TTL:
+            return cached[1]
+        result = func(*args)
+        _cache[key] = (now, result)
+        return result
+    return wrapper
+
+
+def clear_secret_cache():
+    """Clear the secrets TTL cache and cached SDK clients (mainly for tests)."""
+    global _boto_client, _enabled_backends, _backends_snapshot
+    _cache.clear()
+    _boto_client = None
+    _vault_clients.clear()
+    _doppler_sdks.clear()
+    _enabled_backends = None
+    _backends_snapshot = None
+    _get_secret_cached.cache_clear()
+
+
+@_ttl_cache
 def load_secrets_from_aws(secret_name: str) -> Dict[str, Any]:
     """
     Load secrets from AWS Secrets Manager.
@@ -29,11 +84,13 @@ def load_secrets_from_aws(secret_name: str) -> Dict[str, Any]:
     Returns:
         Dict of secrets or empty dict on error
     """
+    global _boto_client
     try:
-        import boto3
-        
-        client = boto3.client('secretsmanager')
-        response = client.get_secret_value(SecretId=secret_name)
+        if _boto_client is None:
+            import boto3
+            _boto_client = boto3.client('secretsmanager')
+
+        response = _boto_client.get_secret_value(SecretId=secret_name)
         secrets = json.loads(response['SecretString'])
         logger.debug(f"Successfully loaded AWS secret: {secret_name}")
         # codeql[py/clear-text-logging-sensitive-data] - Function designed to return secrets
@@ -46,6 +103,7 @@ def load_secrets_from_aws(secret_name: str) -> Dict[str, Any]:
         return {}
 
 
+@_ttl_cache
 def load_secrets_from_vault(secret_path: str) -> Dict[str, Any]:
     """
     Load secrets from HashiCorp Vault.
@@ -57,19 +115,22 @@ def load_secrets_from_vault(secret_path: str) -> Dict[str, Any]:
         Dict of secrets or empty dict on error
     """
     try:
-        import hvac
-        
         vault_url = os.getenv('SECRETS_VAULT_URL')
         vault_token = os.getenv('SECRETS_VAULT_TOKEN')
-        
+
         if not vault_url or not vault_token:
             logger.error("SECRETS_VAULT_URL or SECRETS_VAULT_TOKEN not configured")
             return {}
-        
-        client = hvac.Client(url=vault_url, token=vault_token)
-        if not client.is_authenticated():
-            logger.error("Vault authentication failed")
-            return {}
+
+        client = _vault_clients.get((vault_url, vault_token))
+        if client is None:
+            import hvac
+
+            client = hvac.Client(url=vault_url, token=vault_token)
+            if not client.is_authenticated():
+                logger.error("Vault authentication failed")
+                return {}
+            _vault_clients[(vault_url, vault_token)] = client
         
         response = client.secrets.kv.v2.read_secret_version(path=secret_path)
         secrets = response['data']['data']
@@ -84,6 +145,7 @@ def load_secrets_from_vault(secret_path: str) -> Dict[str, Any]:
         return {}
 
 
+@_ttl_cache
 def load_secrets_from_doppler(secret_name: Optional[str] = None) -> Dict[str, Any]:
     """
     Load secrets from Doppler.
@@ -95,19 +157,22 @@ def load_secrets_from_doppler(secret_name: Optional[str] = None) -> Dict[str, An
         Dict of secrets or empty dict on error
     """
     try:
-        from dopplersdk import DopplerSDK
-        
         doppler_token = os.getenv('DOPPLER_TOKEN')
         if not doppler_token:
             logger.debug("DOPPLER_TOKEN not set")
             return {}
-        
+
         # Get Doppler project and config from environment
         doppler_project = os.getenv('DOPPLER_PROJECT', 'yo-mama-bot')
         doppler_config = os.getenv('DOPPLER_CONFIG', 'dev')
-        
-        sdk = DopplerSDK()
-        sdk.set_access_token(doppler_token)
+
+        sdk = _doppler_sdks.get(doppler_token)
+        if sdk is None:
+            from dopplersdk import DopplerSDK
+
+            sdk = DopplerSDK()
+            sdk.set_access_token(doppler_token)
+            _doppler_sdks[doppler_token] = sdk
         
         # Fetch secrets from the specified project and config
         try:
@@ -120,17 +185,32 @@ def load_secrets_from_doppler(secret_name: Optional[str] = None) -> Dict[str, An
             if hasattr(secrets_response, 'secrets'):
                 all_keys = list(secrets_response.secrets.keys())
                 logger.info(f"Doppler connection successful. Found {len(all_keys)} total secrets")
-                
+
+                # Hoist the prefix casing/length out of the loop
+                if secret_name:
+                    prefix_u = secret_name.upper()
+                    suffix_start = len(secret_name) + 1  # +1 for underscore
+
                 for secret_key, secret_value in secrets_response.secrets.items():
-                    # If secret_name prefix is provided, filter by it
-                    if secret_name:
-                        if secret_key.upper().startswith(secret_name.upper()):
-                            # Extract the actual key name (e.g., CLIENT_ID from DISCORD_CLIENT_ID)
-                            key_suffix = secret_key[len(secret_name)+1:].lower()  # +1 for underscore
-                            secrets_dict[key_suffix] = secret_value.get('computed', secret_value.get('raw', ''))
-                    else:
+                    # EAFP value extraction: 'computed' is present for
+                    # virtually every secret, so the try costs one dict
+                    # lookup vs. two chained .get calls
+                    try:
+                        value = secret_value['computed']
+                    except KeyError:
+                        try:
+                            value = secret_value['raw']
+                        except KeyError:
+                            value = ''
+
+                    # Whole-config fetch is the common case; prefix
+                    # filtering only runs for platform-scoped calls
+                    if not secret_name:
                         # Return all secrets with their full names
-                        secrets_dict[secret_key] = secret_value.get('computed', secret_value.get('raw', ''))
+                        secrets_dict[secret_key] = value
+                    elif secret_key.upper().startswith(prefix_u):
+                        # Extract the actual key name (e.g., CLIENT_ID from DISCORD_CLIENT_ID)
+                        secrets_dict[secret_key[suffix_start:].lower()] = value
                 
                 if secret_name and not secrets_dict:
                     logger.debug(f"No secrets found with prefix '{secret_name}'")
@@ -153,6 +233,133 @@ def load_secrets_from_doppler(secret_name: Optional[str] = None) -> Dict[str, An
         return {}
 
 
+def _doppler_lookup(key_l: str, env_key: str, env_key_l: str,
+                    doppler_prefix: Optional[str],
+                    aws_secret_name: Optional[str],
+                    vault_secret_path: Optional[str]) -> Optional[str]:
+    """Look up a key in Doppler (prefixed bundle first, then direct)."""
+    if doppler_prefix:
+        value = load_secrets_from_doppler(doppler_prefix).get(key_l)
+        if value:
+            return value
+    return load_secrets_from_doppler().get(env_key) or None
+
+
+def _aws_lookup(key_l: str, env_key: str, env_key_l: str,
+                doppler_prefix: Optional[str],
+                aws_secret_name: Optional[str],
+                vault_secret_path: Optional[str]) -> Optional[str]:
+    """Look up a key (short and full env spellings) in AWS Secrets Manager."""
+    if not aws_secret_name:
+        return None
+    secrets = load_secrets_from_aws(aws_secret_name)
+    return secrets.get(key_l) or secrets.get(env_key_l) or None
+
+
+def _vault_lookup(key_l: str, env_key: str, env_key_l: str,
+                  doppler_prefix: Optional[str],
+                  aws_secret_name: Optional[str],
+                  vault_secret_path: Optional[str]) -> Optional[str]:
+    """Look up a key (short and full env spellings) in Vault."""
+    if not vault_secret_path:
+        return None
+    secrets = load_secrets_from_vault(vault_secret_path)
+    return secrets.get(key_l) or secrets.get(env_key_l) or None
+
+
+# Ordered (name, lookup_fn) chain of enabled remote backends, rebuilt
+# only when the controlling environment variables change — so the per-
+# lookup cost is one snapshot compare instead of re-testing each branch
+_enabled_backends: Optional[list] = None
+_backends_snapshot: Optional[tuple] = None
+
+
+def _get_enabled_backends() -> list:
+    """Return the (name, lookup_fn) pairs for the enabled backends."""
+    global _enabled_backends, _backends_snapshot
+
+    snapshot = (os.getenv('DOPPLER_TOKEN'), os.getenv('SECRETS_MANAGER'))
+    if _enabled_backends is None or snapshot != _backends_snapshot:
+        backends = []
+        if snapshot[0]:
+            backends.append(('Doppler', _doppler_lookup))
+        secret_manager = (snapshot[1] or 'none').lower()
+        if secret_manager == 'aws':
+            backends.append(('AWS Secrets Manager', _aws_lookup))
+        elif secret_manager == 'vault':
+            backends.append(('Vault', _vault_lookup))
+        _enabled_backends = backends
+        _backends_snapshot = snapshot
+    return _enabled_backends
+
+
+def _get_secret_impl(
+    key: str,
+    platform: Optional[str],
+    default: Optional[str],
+    aws_secret_name: Optional[str],
+    vault_secret_path: Optional[str],
+    doppler_prefix: Optional[str]
+) -> Optional[str]:
+    """Uncached get_secret body; see get_secret for the contract."""
+    try:
+        # Normalize case once; each .upper()/.lower() allocates a string,
+        # so do it here instead of per backend
+        key_l = key.lower()
+        if platform:
+            env_key = f"{platform.upper()}_{key.upper()}"
+        else:
+            env_key = key.upper()
+        env_key_l = env_key.lower()
+
+        # Priority 1-3: the precomputed remote backend chain, in priority
+        # order (Doppler, then whichever of AWS/Vault is enabled)
+        for backend_name, lookup in _get_enabled_backends():
+            value = lookup(key_l, env_key, env_key_l, doppler_prefix,
+                           aws_secret_name, vault_secret_path)
+            if value:
+                logger.debug(f"Found {env_key} in {backend_name}")
+                return value
+
+        # Priority 4: Fallback to environment variable (.env file)
+        env_value = os.getenv(env_key)
+        if env_value:
+            logger.debug(f"Found {env_key} in environment")
+            return env_value
+        
+        # Priority 5: Return default
+        if default:
+            logger.debug(f"Using default value for {env_key}")
+        else:
+            logger.debug(f"Secret {env_key} not found anywhere")
+        
+        return default
+        
+    except Exception as e:
+        logger.error(f"Error getting secret '{key}': {type(e).__name__}: {e}")
+        return default
+
+
+@functools.lru_cache(maxsize=256)
+def _get_secret_cached(
+    ttl_bucket: int,
+    key: str,
+    platform: Optional[str],
+    default: Optional[str],
+    aws_secret_name: Optional[str],
+    vault_secret_path: Optional[str],
+    doppler_prefix: Optional[str]
+) -> Optional[str]:
+    """TTL-aware memo of _get_secret_impl.
+
+    ttl_bucket is monotonic time quantized to _TTL, so entries are
+    naturally re-resolved once per TTL window and rotated secrets are
+    picked up without anyone calling cache_clear().
+    """
+    return _get_secret_impl(key, platform, default, aws_secret_name,
+                            vault_secret_path, doppler_prefix)
+
+
 def get_secret(
     key: str,
     platform: Optional[str] = None,
@@ -163,14 +370,19 @@ def get_secret(
 ) -> Optional[str]:
     """
     Get a secret value with comprehensive priority system.
-    
+
+    Results are memoized per argument tuple for up to _TTL seconds
+    (matching the backend loaders), so rotated secrets are picked up
+    within the TTL. Call get_secret.cache_clear() (or
+    clear_secret_cache()) to force an immediate re-resolution.
+
     Priority order:
     1. Doppler (if DOPPLER_TOKEN exists) - HIGHEST PRIORITY
     2. AWS Secrets Manager (if SECRETS_MANAGER=aws and aws_secret_name provided)
     3. HashiCorp Vault (if SECRETS_MANAGER=vault and vault_secret_path provided)
     4. Environment variable from .env file - FALLBACK
     5. Default value - LAST RESORT
-    
+
     Args:
         key: Secret key to retrieve (e.g., 'api_key', 'bot_token')
         platform: Optional platform name for env var construction (e.g., 'discord')
@@ -178,14 +390,14 @@ def get_secret(
         aws_secret_name: AWS Secrets Manager secret name
         vault_secret_path: HashiCorp Vault secret path
         doppler_prefix: Doppler secret prefix (e.g., 'DISCORD' for DISCORD_BOT_TOKEN)
-        
+
     Returns:
         Secret value or default
-        
+
     Examples:
         # Simple lookup with env var fallback
         api_key = get_secret('GEMINI_API_KEY')
-        
+
         # Platform-specific with all secret managers
         token = get_secret(
             'bot_token',
@@ -195,83 +407,12 @@ def get_secret(
             doppler_prefix='DISCORD'
         )
     """
-    try:
-        # Construct environment variable name
-        if platform:
-            env_key = f"{platform.upper()}_{key.upper()}"
-        else:
-            env_key = key.upper()
-        
-        # Priority 1: Try Doppler first if DOPPLER_TOKEN exists
-        if os.getenv('DOPPLER_TOKEN'):
-            # Try with doppler_prefix if provided
-            if doppler_prefix:
-                doppler_secrets = load_secrets_from_doppler(doppler_prefix)
-                # Look for the key with or without prefix
-                if key.lower() in doppler_secrets:
-                    value = doppler_secrets[key.lower()]
-                    if value:
-                        logger.debug(f"Found {env_key} in Doppler (with prefix)")
-                        return value
-            
-            # Try direct key lookup in all Doppler secrets
-            all_doppler_secrets = load_secrets_from_doppler()
-            if env_key in all_doppler_secrets:
-                value = all_doppler_secrets[env_key]
-                if value:
-                    logger.debug(f"Found {env_key} in Doppler (direct)")
-                    return value
-        
-        # Check which secrets manager is enabled (AWS/Vault)
-        secret_manager = os.getenv('SECRETS_MANAGER', 'none').lower()
-        
-        # Priority 2: Try AWS Secrets Manager
-        if secret_manager == 'aws' and aws_secret_name:
-            aws_secrets = load_secrets_from_aws(aws_secret_name)
-            if key.lower() in aws_secrets:
-                value = aws_secrets[key.lower()]
-                if value:
-                    logger.debug(f"Found {env_key} in AWS Secrets Manager")
-                    return value
-            # Also try with the full env key
-            if env_key.lower() in aws_secrets:
-                value = aws_secrets[env_key.lower()]
-                if value:
-                    logger.debug(f"Found {env_key} in AWS Secrets Manager")
-                    return value
-        
-        # Priority 3: Try HashiCorp Vault
-        if secret_manager == 'vault' and vault_secret_path:
-            vault_secrets = load_secrets_from_vault(vault_secret_path)
-            if key.lower() in vault_secrets:
-                value = vault_secrets[key.lower()]
-                if value:
-                    logger.debug(f"Found {env_key} in Vault")
-                    return value
-            # Also try with the full env key
-            if env_key.lower() in vault_secrets:
-                value = vault_secrets[env_key.lower()]
-                if value:
-                    logger.debug(f"Found {env_key} in Vault")
-                    return value
-        
-        # Priority 4: Fallback to environment variable (.env file)
-        env_value = os.getenv(env_key)
-        if env_value:
-            logger.debug(f"Found {env_key} in environment")
-            return env_value
-        
-        # Priority 5: Return default
-        if default:
-            logger.debug(f"Using default value for {env_key}")
-        else:
-            logger.debug(f"Secret {env_key} not found anywhere")
-        
-        return default
-        
-    except Exception as e:
-        logger.error(f"Error getting secret '{key}': {type(e).__name__}: {e}")
-        return default
+    return _get_secret_cached(int(time.monotonic() // _TTL), key, platform,
+                              default, aws_secret_name, vault_secret_path,
+                              doppler_prefix)
+
+
+get_secret.cache_clear = _get_secret_cached.cache_clear
 
 
 def get_secrets_for_platform(
@@ -299,15 +440,42 @@ def get_secrets_for_platform(
             aws_secret_name='prod/discord'
         )
     """
+    # Fetch each backend's bundle once up front, then resolve every key
+    # locally with the same priority walk get_secret() uses. This turns
+    # O(keys) backend round-trips into at most four.
+    platform_u = platform.upper()
+
+    prefixed_doppler: Dict[str, Any] = {}
+    all_doppler: Dict[str, Any] = {}
+    if os.getenv('DOPPLER_TOKEN'):
+        prefixed_doppler = load_secrets_from_doppler(platform_u)
+        all_doppler = load_secrets_from_doppler()
+
+    secret_manager = os.getenv('SECRETS_MANAGER', 'none').lower()
+    aws_secrets: Dict[str, Any] = {}
+    if secret_manager == 'aws' and aws_secret_name:
+        aws_secrets = load_secrets_from_aws(aws_secret_name)
+    vault_secrets: Dict[str, Any] = {}
+    if secret_manager == 'vault' and vault_secret_path:
+        vault_secrets = load_secrets_from_vault(vault_secret_path)
+
     result = {}
     for key in keys:
-        result[key] = get_secret(
-            key,
-            platform=platform,
-            aws_secret_name=aws_secret_name,
-            vault_secret_path=vault_secret_path,
-            doppler_prefix=platform.upper()
-        )
+        env_key = f"{platform_u}_{key.upper()}"
+
+        # Priority 1: Doppler (prefixed, then direct)
+        value = prefixed_doppler.get(key.lower()) or all_doppler.get(env_key)
+
+        # Priority 2/3: AWS Secrets Manager / Vault (key, then full env key)
+        if not value:
+            backend = aws_secrets or vault_secrets
+            value = backend.get(key.lower()) or backend.get(env_key.lower())
+
+        # Priority 4: environment variable (.env file)
+        if not value:
+            value = os.getenv(env_key)
+
+        result[key] = value
     return result
 
 
@@ -0,0 +1,92 @@
+# SPDX-FileCopyrightText: 2025 YoMama-as-a-Service contributors
+# SPDX-License-Identifier: MPL-2.0
+"""
+Proactive rate limiting for Gemini API calls.
+
+Token-bucket throttler keyed on requests-per-minute (RPM) and
+tokens-per-minute (TPM) so batch generation paces itself under the
+API quota instead of slamming it and eating 429 retries.
+"""
+
+import time
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Rough token estimate for a prompt (~4 characters per token).
+
+    Good enough for quota pacing; exact counts would need a tokenizer
+    round-trip which defeats the point.
+    """
+    return max(1, len(text) // 4)
+
+
+class AsyncTokenBucket:
+    """
+    Async token bucket limiting requests/min and tokens/min.
+
+    A limit of 0 disables that dimension. acquire() sleeps precisely
+    until capacity refills (monotonic clock, no busy loop).
+    """
+
+    def __init__(self, rpm: int = 0, tpm: int = 0):
+        """
+        Args:
+            rpm: Maximum requests per minute (0 = unlimited)
+            tpm: Maximum tokens per minute (0 = unlimited)
+        """
+        self.rpm = rpm
+        self.tpm = tpm
+
+        self._requests = float(rpm)
+        self._tokens = float(tpm)
+        self._last_refill = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self):
+        """Refill both buckets based on elapsed time."""
+        now = time.monotonic()
+        elapsed = now - self._last_refill
+        self._last_refill = now
+
+        if self.rpm:
+            self._requests = min(float(self.rpm), self._requests + elapsed * self.rpm / 60.0)
+        if self.tpm:
+            self._tokens = min(float(self.tpm), self._tokens + elapsed * self.tpm / 60.0)
+
+    def _wait_time(self, est_tokens: int) -> float:
+        """Seconds to sleep until one request + est_tokens fit."""
+        wait = 0.0
+        if self.rpm and self._requests < 1.0:
+            wait = max(wait, (1.0 - self._requests) * 60.0 / self.rpm)
+        if self.tpm and self._tokens < est_tokens:
+            wait = max(wait, (est_tokens - self._tokens) * 60.0 / self.tpm)
+        return wait
+
+    async def acquire(self, est_tokens: int = 0):
+        """
+        Wait until there is capacity for one request of est_tokens.
+
+        Args:
+            est_tokens: Estimated tokens this request will consume
+                        (only checked when a TPM limit is set)
+        """
+        if not self.rpm and not self.tpm:
+            return
+
+        async with self._lock:
+            self._refill()
+            wait = self._wait_time(est_tokens)
+            if wait > 0:
+                logger.debug(f"Throttling for {wait:.2f}s (RPM/TPM limit)")
+                await asyncio.sleep(wait)
+                self._refill()
+
+            if self.rpm:
+                self._requests -= 1.0
+            if self.tpm:
+                self._tokens -= est_tokens
@@ -7,14 +7,183 @@ Supports multiple flavors (cybersecurity, tech, general) and configurable
 meanness and nerdiness levels.
 """
 
+import asyncio
+import functools
 import logging
 import random
+import re
+import time
+from types import MappingProxyType
 from typing import Literal, Optional
 from google import genai
 
+from .cache import JokePool, LLMCache, SQLiteJokeStore, cache_key
+from .throttle import AsyncTokenBucket, estimate_tokens
+
 logger = logging.getLogger(__name__)
 
 
+# Reuse Gemini clients across generator instances so re-creating a
+# generator (demo steps, multiple bots) doesn't rebuild the HTTP
+# connection pool. The client is model-agnostic, so key on the API key.
+_CLIENT_CACHE: dict[str, genai.Client] = {}
+
+
+def _get_client(api_key: str) -> genai.Client:
+    """Get (or create and cache) a Gemini client for an API key."""
+    client = _CLIENT_CACHE.get(api_key)
+    if client is None:
+        client = _CLIENT_CACHE[api_key] = genai.Client(api_key=api_key)
+    return client
+
+
+def reset_client_cache():
+    """Reset the shared client cache (useful for testing)."""
+    _CLIENT_CACHE.clear()
+
+
+# Transient-error retry policy: attempts beyond the first and the base
+# backoff delay (doubled per retry, with up to 100% jitter)
+_RETRY_ATTEMPTS = 3
+_RETRY_BASE_DELAY = 0.5
+_API_COOLDOWN = 30.0
+
+
+# One compiled case-insensitive scan instead of repeated substring +
+# .lower() passes over the stringified error
+_TRANSIENT_RE = re.compile(r"429|503|quota|rate[ _-]?limit|unavailable|overloaded",
+                           re.IGNORECASE)
+
+
+def _is_transient_error(error: "Exception | str") -> bool:
+    """Whether an error looks like a retryable 429/5xx.
+
+    Prefers the typed status code the google-genai API errors carry;
+    falls back to a regex scan of the message for everything else.
+    """
+    code = getattr(error, 'code', None) or getattr(error, 'status_code', None)
+    if code in (429, 503):
+        return True
+    return _TRANSIENT_RE.search(str(error)) is not None
+
+
+# Canned responses for the error paths, frozen at module level so a
+# failure costs one random.choice / dict lookup with no list rebuild
+_RATE_LIMIT_JOKES: tuple[str, ...] = (
+    "Yo mama hitting this API so hard, even Google told her to slow down! 🚦 (Rate limit exceeded, try again in a minute)",
+    "Yo mama's requests so thicc, the API said 'I need a break!' 💤 (Quota exceeded, please try again later)",
+    "Yo mama making so many requests, the API filed a restraining order! 🚨 (Rate limit hit, chill for a sec)",
+    "Yo mama so demanding, she exceeded her quota faster than a script kiddie with a new API key! ⚠️ (Try again in 60 seconds)",
+    "Yo mama hit that rate limit so fast, even the API was like 'Damn girl, pace yourself!' 🔥 (Quota exceeded, wait a minute)",
+    "Yo mama's API calls so excessive, Google Gemini ghosted her! 👻 (Rate limit reached, try again soon)",
+)
+
+_FALLBACK_JOKES = MappingProxyType({
+    'cybersecurity': "Yo mama so insecure, even CrowdStrike flagged her as a vulnerability.",
+    'tech': "Yo mama so slow, buffering gives up and goes home.",
+    'linux': "Yo mama so bloated, even apt-get couldn't remove her dependencies.",
+    'general': "Yo mama so old, her password is literally 'password'.",
+    'gaming': "Yo mama so laggy, ping timeout became her nickname.",
+    'programming': "Yo mama so buggy, Stack Overflow created a tag just for her.",
+    'radio': "Yo mama so noisy, she causes interference on all bands at once - 73!",
+    'thegame': "Congratulations! You just lost The Game. And so did everyone reading this. Sorry not sorry. 🎮💀",
+})
+
+_DEFAULT_FALLBACK_JOKE = "Yo mama so outdated, even legacy systems moved on."
+
+
+# Flavor-specific prompt context
+FLAVOR_CONTEXTS = {
+    'classic': 'CLASSIC traditional Yo Mama jokes - use timeless formats like "so fat", "so ugly", "so old", "so stupid", "so poor", "so hairy", "so short", "so tall". Examples: "Yo mama so fat when sitting around the house, literally sits AROUND the house", "Yo mama so fat the scale said \'I need your weight not your phone number\'", "Yo mama so fat I took a picture last Christmas and it\'s still printing". Keep it traditional, punchy, and non-technical. Use gender-neutral language.',
+    'cybersecurity': 'cybersecurity, hacking, vulnerabilities, security tools like CrowdStrike, Shodan, Suricata, Wazuh, firewalls, encryption, CVEs',
+    'tech': 'technology, computers, software, hardware, operating systems, IT support, tech companies',
+    'linux': 'Linux, Unix, open source, command line, distros, kernel, bash, system administration, package managers',
+    'general': 'everyday technology, smartphones, social media, internet, basic computing',
+    'gaming': 'video games, gaming hardware, esports, game development, streaming, lag, FPS',
+    'programming': 'coding, programming languages, APIs, debugging, git, IDEs, software development',
+    'networking': 'networks, routers, switches, protocols, TCP/IP, DNS, load balancing, bandwidth',
+    'cloud': 'cloud computing, AWS, Azure, GCP, containers, Kubernetes, serverless, microservices',
+    'devops': 'DevOps, CI/CD, Docker, Jenkins, automation, infrastructure as code, monitoring',
+    'database': 'databases, SQL, NoSQL, queries, indexes, normalization, database administrators',
+    'radio': 'amateur radio, ham radio, frequencies, bands (HF/VHF/UHF), antennas, SWR, propagation, callsigns, morse code, repeaters, QSO, QSL cards, ARRL, FCC licenses (Technician/General/Extra), rigs, transceivers, DX, contestin',
+    'thegame': 'The Game - a mind game where thinking about The Game means you lose. Create creative, funny ways to tell them they just lost The Game. Be clever and unexpected. Reference memes, internet culture, or tech concepts if appropriate.'
+}
+
+# Meanness guidance per level (tuple indexed by level-1: plain array
+# indexing, no hashing, nothing allocated per lookup)
+MEANNESS_GUIDE = (
+    'extremely gentle and wholesome, just playful teasing',
+    'mild and friendly, very light roasting',
+    'gentle but with a slight edge',
+    'moderately playful with some bite',
+    'balanced roasting, noticeable but not harsh',
+    'firm roasting with clear jabs',
+    'harsh and pointed, definitely stinging',
+    'brutal and savage, no holding back',
+    'devastatingly mean, almost cruel',
+    'absolutely merciless and nuclear-level savage',
+    'THESE GO TO ELEVEN - ABSOLUTELY RUTHLESS AND DEVASTATING - go for the jugular with no mercy whatsoever. Use the most cutting, brutal, savage insults possible. Make it genuinely offensive and shocking. Hold nothing back. This should be emotionally destructive and leave lasting damage. Thermonuclear-level roast that would make a comedian wince. ONE LOUDER than 10.'
+)
+
+# Nerdiness guidance per level (tuple indexed by level-1)
+NERDINESS_GUIDE = (
+    'use only basic everyday terms anyone would understand',
+    'use simple tech terms most people know',
+    'use common tech concepts',
+    'use moderately technical terms',
+    'use technical jargon that tech-savvy people know',
+    'use specialized technical terms',
+    'use insider technical references and acronyms',
+    'use advanced technical concepts and tools',
+    'use highly specialized technical knowledge',
+    'use extremely obscure technical references only experts would get'
+)
+
+# Base prompt with runtime placeholders; the flavor parts get baked in
+# below. Deliberately terse — every input token is paid on every call —
+# and ordered static-first: the theme/rules lines are identical across
+# calls for a given flavor, so Gemini's implicit prefix caching can
+# reuse the tokenized preamble. (Explicit caches.create is not worth it
+# here — the prompt sits below the model's minimum cacheable token
+# count.) The old EXAMPLES block is gone: it hardcoded cybersecurity
+# jokes for every flavor and tripled the prompt size.
+_PROMPT_TEMPLATE = """Write ONE "Yo Mama" style joke.
+Theme: {flavor} ({flavor_context})
+Rules: relate it to {flavor}; 1-2 sentences max; creative, funny, original; gender-neutral language (they/them or no pronouns).
+Meanness {meanness}/10: {meanness_guide}
+Nerdiness {nerdiness}/10: {nerdiness_guide}
+Use "{target}" instead of "yo mama" and start with "{target_cap} so [adjective]...".
+Output only the joke:"""
+
+# Per-flavor templates, precomputed once at import so generate_joke only
+# fills in the per-call values (format_map skips kwargs parsing)
+FLAVOR_TEMPLATES = {
+    flavor: _PROMPT_TEMPLATE
+        .replace('{flavor_context}', context)
+        .replace('{flavor}', flavor)
+    for flavor, context in FLAVOR_CONTEXTS.items()
+}
+
+
+@functools.lru_cache(maxsize=4096)
+def _build_prompt_cached(flavor: str, meanness: int, nerdiness: int, target: str) -> str:
+    """Fill a flavor template; memoized since the parameter domain is tiny.
+
+    13 flavors x 11 x 10 levels is ~1400 distinct prompts for the
+    default target, so repeat generations become a dict hit instead of
+    a format_map. Custom targets share the same bounded cache.
+    """
+    template = FLAVOR_TEMPLATES.get(flavor, FLAVOR_TEMPLATES['general'])
+    return template.format_map({
+        'meanness': meanness,
+        'meanness_guide': MEANNESS_GUIDE[meanness - 1],
+        'nerdiness': nerdiness,
+        'nerdiness_guide': NERDINESS_GUIDE[nerdiness - 1],
+        'target': target,
+        'target_cap': target.capitalize(),
+    })
+
+
 class YoMamaGenerator:
     """
     Generate Yo Mama jokes with customizable flavors and intensity levels.
@@ -25,8 +194,8 @@ class YoMamaGenerator:
     - Nerdiness: 1-10 scale (1=accessible, 10=extremely technical)
     """
     
-    # Available joke flavors
-    FLAVORS = [
+    # Available joke flavors (immutable; fixed at import time)
+    FLAVORS = (
         'classic',        # Traditional Yo Mama jokes (so fat, so ugly, etc.)
         'cybersecurity',
         'tech',
@@ -40,23 +209,63 @@ class YoMamaGenerator:
         'database',
         'radio',          # Amateur radio / ham radio
         'thegame'         # Hidden Easter egg - You just lost The Game
-    ]
-    
-    def __init__(self, api_key: str, model_name: str = "gemini-2.5-flash-lite"):
+    )
+
+    # Frozen copy for O(1) membership checks on hot paths
+    _FLAVORS_SET = frozenset(FLAVORS)
+
+    def __init__(
+        self,
+        api_key: str,
+        model_name: str = "gemini-2.5-flash-lite",
+        cache: Optional[LLMCache] = None,
+        max_concurrency: int = 5,
+        throttle: Optional[AsyncTokenBucket] = None,
+        cache_path: Optional[str] = None
+    ):
         """
         Initialize the Yo Mama joke generator.
-        
+
         Args:
             api_key: Google Gemini API key
             model_name: Gemini model to use (default: gemini-2.5-flash-lite)
+            cache: Optional response cache (see yo_mama.cache.LLMCache).
+                   If set, identical requests return cached jokes instead
+                   of calling Gemini again.
+            max_concurrency: Maximum concurrent Gemini requests in batch mode
+            throttle: Optional RPM/TPM token bucket (see yo_mama.throttle).
+                      If set, async generation paces itself under the
+                      API quota instead of relying on 429 backoff.
+            cache_path: Optional SQLite file backing the joke pool
+                        (see yo_mama.cache.SQLiteJokeStore). If set, jokes
+                        persist across restarts and are shared between
+                        worker processes.
         """
         self.api_key = api_key
         self.model_name = model_name
-        
-        # Create Gemini client
-        self.client = genai.Client(api_key=api_key)
-        
-        logger.info(f"Initialized YoMamaGenerator with model: {model_name}")
+        self.cache = cache
+        self.max_concurrency = max_concurrency
+        self.throttle = throttle
+
+        # Get the (shared) Gemini client
+        self.client = _get_client(api_key)
+
+        # Variety-preserving pool of recent results per parameter tuple:
+        # bursts of identical requests are sometimes served with zero RTT
+        # instead of a fresh API call. Personalized jokes bypass it.
+        self._joke_pool = JokePool(per_key=16, min_pool=1, hit_rate=0.3)
+        self._pool_hits = 0
+        self._pool_lookups = 0
+
+        # Optional durable pool: survives restarts and is shared across
+        # workers, so a fresh process starts warm instead of empty
+        self._joke_store = SQLiteJokeStore(cache_path) if cache_path else None
+
+        # After a rate-limit/transient failure, skip the network entirely
+        # for a short window instead of letting every caller burn retries
+        self._api_cooldown_until = 0.0
+
+        logger.info("Initialized YoMamaGenerator with model: %s", model_name)
     
     def generate_joke(
         self,
@@ -84,154 +293,242 @@ class YoMamaGenerator:
         Returns:
             Generated joke as a string
         """
-        # Validate and normalize inputs
-        if flavor and flavor.lower() not in self.FLAVORS:
-            logger.warning(f"Unknown flavor '{flavor}', using random")
-            flavor = None
-        
+        # Validate and normalize inputs (lowercase once; frozenset
+        # membership is O(1))
         if flavor is None:
             flavor = random.choice(self.FLAVORS)
         else:
-            flavor = flavor.lower()
+            lowered = flavor.lower()
+            if lowered not in self._FLAVORS_SET:
+                logger.warning("Unknown flavor '%s', using random", flavor)
+                flavor = random.choice(self.FLAVORS)
+            else:
+                flavor = lowered
         
         meanness = max(1, min(11, meanness))  # These go to eleven!
         nerdiness = max(1, min(10, nerdiness))
-        
+
+        return self._generate_validated(flavor, meanness, nerdiness, target_name)
+
+    def _generate_validated(
+        self,
+        flavor: str,
+        meanness: int,
+        nerdiness: int,
+        target_name: Optional[str]
+    ) -> str:
+        """Generate with already-normalized parameters (no re-validation).
+
+        Fast path shared by generate_joke and random_joke; callers must
+        pass a known lowercase flavor and in-range levels.
+        """
+        # Check the response cache (keyed on the resolved parameters)
+        key = None
+        if self.cache is not None:
+            key = cache_key(self.model_name, flavor, meanness, nerdiness, target_name)
+            cached = self.cache.get(key)
+            if cached is not None:
+                logger.info("Returning cached %s joke (M:%d, N:%d)", flavor, meanness, nerdiness)
+                return cached
+
+        # Probabilistically serve a recent joke for the same parameters
+        # (zero round trips; the pool keeps output varied)
+        pool_key = None
+        if target_name is None:
+            pool_key = (flavor, meanness, nerdiness)
+            self._pool_lookups += 1
+            pooled = self._joke_pool.sample(pool_key)
+            if pooled is not None:
+                self._pool_hits += 1
+                return pooled
+
+            # Durable tier: jokes persisted by earlier runs/other workers
+            if self._joke_store is not None:
+                stored = self._joke_store.sample(flavor, meanness, nerdiness)
+                if stored is not None:
+                    self._pool_hits += 1
+                    return stored
+
+        # During a cooldown window the API is known to be throttling us;
+        # answer immediately rather than burning another round of retries
+        if time.monotonic() < self._api_cooldown_until:
+            logger.info("API cooldown active, serving rate-limit joke")
+            return random.choice(_RATE_LIMIT_JOKES)
+
         # Build the prompt
         prompt = self._build_prompt(flavor, meanness, nerdiness, target_name)
-        
-        try:
-            # Generate the joke
-            response = self.client.models.generate_content(
-                model=self.model_name,
-                contents=prompt
-            )
-            joke = response.text.strip()
-            
-            logger.info(f"Generated {flavor} joke (M:{meanness}, N:{nerdiness})")
-            return joke
-            
-        except Exception as e:
-            error_msg = str(e)
-            logger.error(f"Failed to generate joke: {e}")
-            
-            # Check if it's a rate limit/quota error (429)
-            if "429" in error_msg or "quota" in error_msg.lower() or "rate limit" in error_msg.lower():
-                rate_limit_jokes = [
-                    "Yo mama hitting this API so hard, even Google told her to slow down! 🚦 (Rate limit exceeded, try again in a minute)",
-                    "Yo mama's requests so thicc, the API said 'I need a break!' 💤 (Quota exceeded, please try again later)",
-                    "Yo mama making so many requests, the API filed a restraining order! 🚨 (Rate limit hit, chill for a sec)",
-                    "Yo mama so demanding, she exceeded her quota faster than a script kiddie with a new API key! ⚠️ (Try again in 60 seconds)",
-                    "Yo mama hit that rate limit so fast, even the API was like 'Damn girl, pace yourself!' 🔥 (Quota exceeded, wait a minute)",
-                    "Yo mama's API calls so excessive, Google Gemini ghosted her! 👻 (Rate limit reached, try again soon)"
-                ]
-                return random.choice(rate_limit_jokes)
-            
-            # For other errors, use fallback joke
-            return self._get_fallback_joke(flavor)
-    
-    def _build_prompt(
+
+        # Generate the joke, retrying transient 429/5xx with
+        # exponential backoff + jitter before falling back
+        delay = _RETRY_BASE_DELAY
+        for attempt in range(_RETRY_ATTEMPTS + 1):
+            try:
+                response = self.client.models.generate_content(
+                    model=self.model_name,
+                    contents=prompt
+                )
+                joke = response.text.strip()
+
+                logger.info("Generated %s joke (M:%d, N:%d)", flavor, meanness, nerdiness)
+
+                if self.cache is not None:
+                    self.cache.set(key, joke)
+                if pool_key is not None:
+                    self._joke_pool.add(pool_key, joke)
+                    if self._joke_store is not None:
+                        self._joke_store.add(flavor, meanness, nerdiness, joke)
+
+                return joke
+
+            except Exception as e:
+                if attempt >= _RETRY_ATTEMPTS or not _is_transient_error(e):
+                    return self._error_fallback(e, flavor)
+                logger.warning("Transient error (attempt %d), retrying: %s", attempt + 1, e)
+                time.sleep(delay + random.random() * delay)
+                delay *= 2
+
+    async def generate_joke_async(
+        self,
+        flavor: Optional[str] = None,
+        meanness: int = 5,
+        nerdiness: int = 5,
+        target_name: Optional[str] = None
+    ) -> str:
+        """
+        Async variant of generate_joke using the Gemini async client.
+
+        Same parameters and fallback behavior as generate_joke; used by
+        the batch path and by bot handlers so the event loop is never
+        blocked on a Gemini round trip.
+        """
+        # Validate and normalize inputs (lowercase once; frozenset
+        # membership is O(1))
+        if flavor is None:
+            flavor = random.choice(self.FLAVORS)
+        else:
+            lowered = flavor.lower()
+            if lowered not in self._FLAVORS_SET:
+                logger.warning("Unknown flavor '%s', using random", flavor)
+                flavor = random.choice(self.FLAVORS)
+            else:
+                flavor = lowered
+
+        meanness = max(1, min(11, meanness))  # These go to eleven!
+        nerdiness = max(1, min(10, nerdiness))
+
+        return await self._generate_validated_async(flavor, meanness, nerdiness, target_name)
+
+    async def _generate_validated_async(
         self,
         flavor: str,
         meanness: int,
         nerdiness: int,
         target_name: Optional[str]
     ) -> str:
-        """Build the prompt for Gemini based on parameters."""
-        
-        # Define flavor-specific context
-        flavor_contexts = {
-            'classic': 'CLASSIC traditional Yo Mama jokes - use timeless formats like "so fat", "so ugly", "so old", "so stupid", "so poor", "so hairy", "so short", "so tall". Examples: "Yo mama so fat when sitting around the house, literally sits AROUND the house", "Yo mama so fat the scale said \'I need your weight not your phone number\'", "Yo mama so fat I took a picture last Christmas and it\'s still printing". Keep it traditional, punchy, and non-technical. Use gender-neutral language.',
-            'cybersecurity': 'cybersecurity, hacking, vulnerabilities, security tools like CrowdStrike, Shodan, Suricata, Wazuh, firewalls, encryption, CVEs',
-            'tech': 'technology, computers, software, hardware, operating systems, IT support, tech companies',
-            'linux': 'Linux, Unix, open source, command line, distros, kernel, bash, system administration, package managers',
-            'general': 'everyday technology, smartphones, social media, internet, basic computing',
-            'gaming': 'video games, gaming hardware, esports, game development, streaming, lag, FPS',
-            'programming': 'coding, programming languages, APIs, debugging, git, IDEs, software development',
-            'networking': 'networks, routers, switches, protocols, TCP/IP, DNS, load balancing, bandwidth',
-            'cloud': 'cloud computing, AWS, Azure, GCP, containers, Kubernetes, serverless, microservices',
-            'devops': 'DevOps, CI/CD, Docker, Jenkins, automation, infrastructure as code, monitoring',
-            'database': 'databases, SQL, NoSQL, queries, indexes, normalization, database administrators',
-            'radio': 'amateur radio, ham radio, frequencies, bands (HF/VHF/UHF), antennas, SWR, propagation, callsigns, morse code, repeaters, QSO, QSL cards, ARRL, FCC licenses (Technician/General/Extra), rigs, transceivers, DX, contestin',
-            'thegame': 'The Game - a mind game where thinking about The Game means you lose. Create creative, funny ways to tell them they just lost The Game. Be clever and unexpected. Reference memes, internet culture, or tech concepts if appropriate.'
-        }
-        
-        flavor_context = flavor_contexts.get(flavor, 'general technology')
-        
-        # Define meanness guidance
-        meanness_guide = {
-            1: 'extremely gentle and wholesome, just playful teasing',
-            2: 'mild and friendly, very light roasting',
-            3: 'gentle but with a slight edge',
-            4: 'moderately playful with some bite',
-            5: 'balanced roasting, noticeable but not harsh',
-            6: 'firm roasting with clear jabs',
-            7: 'harsh and pointed, definitely stinging',
-            8: 'brutal and savage, no holding back',
-            9: 'devastatingly mean, almost cruel',
-            10: 'absolutely merciless and nuclear-level savage',
-            11: 'THESE GO TO ELEVEN - ABSOLUTELY RUTHLESS AND DEVASTATING - go for the jugular with no mercy whatsoever. Use the most cutting, brutal, savage insults possible. Make it genuinely offensive and shocking. Hold nothing back. This should be emotionally destructive and leave lasting damage. Thermonuclear-level roast that would make a comedian wince. ONE LOUDER than 10.'
-        }
-        
-        # Define nerdiness guidance
-        nerdiness_guide = {
-            1: 'use only basic everyday terms anyone would understand',
-            2: 'use simple tech terms most people know',
-            3: 'use common tech concepts',
-            4: 'use moderately technical terms',
-            5: 'use technical jargon that tech-savvy people know',
-            6: 'use specialized technical terms',
-            7: 'use insider technical references and acronyms',
-            8: 'use advanced technical concepts and tools',
-            9: 'use highly specialized technical knowledge',
-            10: 'use extremely obscure technical references only experts would get'
-        }
-        
-        target = target_name if target_name else "yo mama"
-        
-        prompt = f"""Generate a single "Yo Mama" style joke with these specifications:
+        """Async twin of _generate_validated; same caller contract."""
+        # Check the response cache (keyed on the resolved parameters)
+        key = None
+        if self.cache is not None:
+            key = cache_key(self.model_name, flavor, meanness, nerdiness, target_name)
+            cached = self.cache.get(key)
+            if cached is not None:
+                logger.info("Returning cached %s joke (M:%d, N:%d)", flavor, meanness, nerdiness)
+                return cached
+
+        # Probabilistically serve a recent joke for the same parameters
+        # (zero round trips; the pool keeps output varied)
+        pool_key = None
+        if target_name is None:
+            pool_key = (flavor, meanness, nerdiness)
+            self._pool_lookups += 1
+            pooled = self._joke_pool.sample(pool_key)
+            if pooled is not None:
+                self._pool_hits += 1
+                return pooled
+
+            # Durable tier: jokes persisted by earlier runs/other workers
+            if self._joke_store is not None:
+                stored = self._joke_store.sample(flavor, meanness, nerdiness)
+                if stored is not None:
+                    self._pool_hits += 1
+                    return stored
 
-THEME/FLAVOR: {flavor} - Focus on {flavor_context}
+        # During a cooldown window the API is known to be throttling us;
+        # answer immediately rather than burning another round of retries
+        if time.monotonic() < self._api_cooldown_until:
+            logger.info("API cooldown active, serving rate-limit joke")
+            return random.choice(_RATE_LIMIT_JOKES)
+
+        # Build the prompt
+        prompt = self._build_prompt(flavor, meanness, nerdiness, target_name)
 
-MEANNESS LEVEL: {meanness}/10 - {meanness_guide[meanness]}
+        # Pace ourselves under the API quota before firing the request
+        if self.throttle is not None:
+            await self.throttle.acquire(estimate_tokens(prompt))
 
-NERDINESS LEVEL: {nerdiness}/10 - {nerdiness_guide[nerdiness]}
+        # Generate the joke, retrying transient 429/5xx with
+        # exponential backoff + jitter before falling back
+        delay = _RETRY_BASE_DELAY
+        for attempt in range(_RETRY_ATTEMPTS + 1):
+            try:
+                response = await self.client.aio.models.generate_content(
+                    model=self.model_name,
+                    contents=prompt
+                )
+                joke = response.text.strip()
 
-TARGET: Use "{target}" instead of "yo mama"
+                logger.info("Generated %s joke (M:%d, N:%d)", flavor, meanness, nerdiness)
 
-REQUIREMENTS:
-- Start with "{target.capitalize()} so [adjective]..."
-- The joke must be related to {flavor}
-- Match the specified meanness and nerdiness levels precisely
-- Be creative and clever
-- Keep it concise (1-2 sentences max)
-- Make it funny and original
-- Use gender-neutral language: avoid pronouns like "she/her/he/him" - use "they/them" or avoid pronouns entirely
+                if self.cache is not None:
+                    self.cache.set(key, joke)
+                if pool_key is not None:
+                    self._joke_pool.add(pool_key, joke)
+                    if self._joke_store is not None:
+                        self._joke_store.add(flavor, meanness, nerdiness, joke)
 
-EXAMPLES for reference (adjust based on parameters):
+                return joke
 
-{flavor} examples:
-- Yo mama so insecure, even CrowdStrike put her in Reduced Functionality Mode.
-- Yo mama so exposed, Shodan sends her vulnerability reports.
-- Yo mama so slow, when she tried to catch up on her emails, Outlook timed her out.
+            except Exception as e:
+                if attempt >= _RETRY_ATTEMPTS or not _is_transient_error(e):
+                    return self._error_fallback(e, flavor)
+                logger.warning("Transient error (attempt %d), retrying: %s", attempt + 1, e)
+                await asyncio.sleep(delay + random.random() * delay)
+                delay *= 2
 
-Generate ONE joke now, matching all specifications:"""
+    @property
+    def cache_hit_rate(self) -> float:
+        """Fraction of pool-eligible requests served from the joke pool."""
+        if self._pool_lookups == 0:
+            return 0.0
+        return self._pool_hits / self._pool_lookups
+
+    def _error_fallback(self, error: Exception, flavor: str) -> str:
+        """Turn a generation error into a rate-limit joke or fallback joke."""
+        logger.error("Failed to generate joke: %s", error)
+
+        # Check if it's a rate limit/quota error (429); start a cooldown
+        # so concurrent/subsequent requests fail fast instead of retrying
+        if _is_transient_error(error):
+            self._api_cooldown_until = time.monotonic() + _API_COOLDOWN
+            return random.choice(_RATE_LIMIT_JOKES)
+
+        # For other errors, use fallback joke
+        return self._get_fallback_joke(flavor)
+
+    def _build_prompt(
+        self,
+        flavor: str,
+        meanness: int,
+        nerdiness: int,
+        target_name: Optional[str]
+    ) -> str:
+        """Build the prompt for Gemini based on parameters."""
+        return _build_prompt_cached(flavor, meanness, nerdiness,
+                                    target_name or "yo mama")
 
-        return prompt
-    
     def _get_fallback_joke(self, flavor: str) -> str:
         """Return a fallback joke if generation fails."""
-        fallbacks = {
-            'cybersecurity': "Yo mama so insecure, even CrowdStrike flagged her as a vulnerability.",
-            'tech': "Yo mama so slow, buffering gives up and goes home.",
-            'linux': "Yo mama so bloated, even apt-get couldn't remove her dependencies.",
-            'general': "Yo mama so old, her password is literally 'password'.",
-            'gaming': "Yo mama so laggy, ping timeout became her nickname.",
-            'programming': "Yo mama so buggy, Stack Overflow created a tag just for her.",
-            'radio': "Yo mama so noisy, she causes interference on all bands at once - 73!",
-            'thegame': "Congratulations! You just lost The Game. And so did everyone reading this. Sorry not sorry. 🎮💀",
-        }
-        return fallbacks.get(flavor, "Yo mama so outdated, even legacy systems moved on.")
+        return _FALLBACK_JOKES.get(flavor, _DEFAULT_FALLBACK_JOKE)
     
     def generate_batch(
         self,
@@ -254,6 +551,20 @@ Generate ONE joke now, matching all specifications:"""
         Returns:
             List of generated jokes
         """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            # No event loop running — drive the batch concurrently
+            return asyncio.run(self.generate_batch_async(
+                count=count,
+                flavor=flavor,
+                meanness=meanness,
+                nerdiness=nerdiness,
+                target_name=target_name
+            ))
+
+        # Called from inside a running event loop (e.g. a bot handler) —
+        # asyncio.run is not allowed here, so fall back to serial generation
         jokes = []
         for i in range(count):
             try:
@@ -265,8 +576,53 @@ Generate ONE joke now, matching all specifications:"""
                 )
                 jokes.append(joke)
             except Exception as e:
-                logger.error(f"Failed to generate joke {i+1}/{count}: {e}")
-        
+                logger.error("Failed to generate joke %d/%d: %s", i + 1, count, e)
+
+        return jokes
+
+    async def generate_batch_async(
+        self,
+        count: int,
+        flavor: Optional[str] = None,
+        meanness: int = 5,
+        nerdiness: int = 5,
+        target_name: Optional[str] = None
+    ) -> list[str]:
+        """Generate count jokes concurrently, bounded by max_concurrency.
+
+        Await this directly from async callers (bot handlers) so the
+        batch overlaps its Gemini calls instead of serializing them.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        # Pre-sample the random flavors in one call instead of letting
+        # each request re-roll inside generate_joke_async
+        if flavor is None:
+            flavors = random.choices(self.FLAVORS, k=count)
+        else:
+            flavors = [flavor] * count
+
+        async def bounded_call(joke_flavor: Optional[str]) -> str:
+            async with semaphore:
+                return await self.generate_joke_async(
+                    flavor=joke_flavor,
+                    meanness=meanness,
+                    nerdiness=nerdiness,
+                    target_name=target_name
+                )
+
+        results = await asyncio.gather(
+            *(bounded_call(joke_flavor) for joke_flavor in flavors),
+            return_exceptions=True
+        )
+
+        jokes = []
+        for i, result in enumerate(results):
+            if isinstance(result, Exception):
+                logger.error("Failed to generate joke %d/%d: %s", i + 1, count, result)
+            else:
+                jokes.append(result)
+
         return jokes
     
     def random_joke(self) -> str:
@@ -274,14 +630,24 @@ Generate ONE joke now, matching all specifications:"""
         flavor = random.choice(self.FLAVORS)
         meanness = random.randint(3, 7)  # Moderate range
         nerdiness = random.randint(3, 7)  # Moderate range
-        
-        return self.generate_joke(
-            flavor=flavor,
-            meanness=meanness,
-            nerdiness=nerdiness
-        )
+
+        # Parameters are drawn from known-good ranges; skip re-validation
+        return self._generate_validated(flavor, meanness, nerdiness, None)
+
+    async def random_joke_async(self) -> str:
+        """Async variant of random_joke for use from event loops."""
+        flavor = random.choice(self.FLAVORS)
+        meanness = random.randint(3, 7)  # Moderate range
+        nerdiness = random.randint(3, 7)  # Moderate range
+
+        return await self._generate_validated_async(flavor, meanness, nerdiness, None)
     
     @staticmethod
-    def list_flavors() -> list[str]:
-        """Get list of available joke flavors."""
-        return YoMamaGenerator.FLAVORS.copy()
+    def list_flavors() -> tuple[str, ...]:
+        """Get the available joke flavors (shared immutable tuple)."""
+        return YoMamaGenerator.FLAVORS
+
+    @classmethod
+    def is_flavor(cls, name: str) -> bool:
+        """Check whether a name is a known flavor (case-insensitive, O(1))."""
+        return name.lower() in cls._FLAVORS_SET